@@ -0,0 +1,347 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+"""
+처리 단계별 벤치마크. 합성 데이터(행 수 조절 가능)로 각 단계의 시간, rows/sec, peak memory 를 측정하고
+결과를 JSON 으로 저장해서 commit 간 비교(회귀 확인)에 사용.
+
+1. make_dirty_frame(): 지저분한 추출 데이터 생성. _no/_amt/_rat/_ym/_dtm 컬럼 + 문자열 컬럼.
+   bad_rate 비율만큼 null 토큰/깨진 값이 섞이고, _dtm 컬럼은 date_formats 가 섞인 날짜 문자열.
+2. make_wine_frame(): winequality-white.csv 를 rows 행까지 반복한 복사본 (alcohol 은 "R$ 45.512,00" 형식).
+3. run_benchmarks(): STAGES 의 각 단계를 sizes 별로 실행. 시간은 tracemalloc 없이 측정하고,
+   peak memory 는 tracemalloc 을 켠 별도 실행에서 측정(Python/NumPy heap 기준, Arrow 메모리는 제외).
+   단계마다 max_rows 보다 큰 크기는 건너뜀(셀 단위 구현, PDF 렌더링 등).
+4. compare_results(): 두 결과 JSON 의 단계별 시간 비교.
+
+python benchmark.py                                   # 10k / 1M / 10M 행, 모든 단계
+python benchmark.py --sizes 10000 100000 --stages clean_dataframe summarize_dataframe
+python benchmark.py --compare benchmark_results/old.json benchmark_results/new.json
+"""
+
+WINE_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'winequality-white.csv')
+RESULT_DIR = 'benchmark_results'
+DEFAULT_SIZES = (10_000, 1_000_000, 10_000_000)
+BAD_TOKENS = np.array(['', 'null', 'NULL', 'None', 'nan', '-', '*', ' - ', '4-', '#N/A'], dtype=object)
+DATE_FORMATS = ('%Y%m%d', '%Y-%m-%d', '%Y%m%d%H%M%S', '%Y-%m-%d %H:%M:%S', '%Y%m')
+
+
+# -------------------------------------------------
+# Synthetic data
+
+def _inject_bad(series, bad_rate, rng):
+    """문자열 Series 의 bad_rate 비율 위치에 null 토큰/깨진 값을 넣음"""
+    mask = rng.random(len(series)) < bad_rate
+    series[mask] = rng.choice(BAD_TOKENS, int(mask.sum()))
+    return series
+
+
+def _date_pool(formats, days, rng):
+    """날짜 days 개 x formats 의 문자열 pool (strftime 은 pool 에만, 행 생성은 take)"""
+    base = pd.Timestamp('2015-01-01') + pd.to_timedelta(np.arange(days), unit='D')
+    stamps = base + pd.to_timedelta(rng.integers(0, 86400, days), unit='s')
+    return np.array([stamps.strftime(fmt) for fmt in formats], dtype=object)
+
+
+def make_dirty_frame(rows, bad_rate=0.05, date_formats=DATE_FORMATS, seed=0):
+    """
+    type_of_column 으로 정제할 지저분한 추출 데이터 생성 (모든 값은 문자열).
+
+    Parameters:
+        rows (int): 행 수
+        bad_rate (float): 컬럼별 null 토큰/깨진 값 비율
+        date_formats (Iterable[str]): _dtm 컬럼에 섞을 날짜 형식 (행마다 무작위)
+        seed (int): 난수 seed
+
+    Returns:
+        pd.DataFrame: cust_no, sale_amt, disc_rat, sale_ym, reg_dtm, branch_nm, memo 컬럼
+    """
+    rng = np.random.default_rng(seed)
+    pool = _date_pool(date_formats, 3650, rng)
+    months = pd.period_range('2015-01', periods=120, freq='M').strftime('%Y%m').to_numpy(dtype=object)
+    branches = np.array([f"지점{i:03d}" for i in range(200)], dtype=object)
+
+    # 컬럼마다 바로 pandas 문자열로 변환 (NumPy unicode 중간 배열을 만들지 않아 10M 행도 메모리 적게 씀)
+    columns = {
+        'cust_no': pd.Series(rng.integers(0, max(rows // 3, 1), rows)).astype(str),
+        'sale_amt': pd.Series(np.round(rng.lognormal(8, 1.5, rows), 2)).astype(str),
+        'disc_rat': pd.Series(np.round(rng.random(rows), 3)).astype(str),
+        'sale_ym': pd.Series(months[rng.integers(0, len(months), rows)]),
+        'reg_dtm': pd.Series(pool[rng.integers(0, pool.shape[0], rows), rng.integers(0, pool.shape[1], rows)]),
+        'branch_nm': pd.Series(branches[rng.integers(0, len(branches), rows)]),
+    }
+    for col in columns:
+        columns[col] = _inject_bad(columns[col], bad_rate, rng)
+    columns['memo'] = 'memo ' + pd.Series(np.arange(rows)).astype(str)
+    return pd.DataFrame(columns)
+
+
+def make_wine_frame(rows, path=WINE_CSV):
+    """winequality-white.csv 를 rows 행이 될 때까지 반복한 DataFrame (모든 값은 문자열, RangeIndex)"""
+    wine = pd.read_csv(path, dtype=str)
+    return wine.iloc[np.resize(np.arange(len(wine)), rows)].reset_index(drop=True)
+
+
+# -------------------------------------------------
+# Stages: func(data, tmp_dir) 가 측정 대상. prepare(data, tmp_dir) 결과가 있으면 그것을 func 에 넘김(측정 제외).
+
+def _clean_scalar(df, tmp_dir):
+    # clean_df_data: 셀마다 clean_value (scalar apply 경로)
+    import clean_df_data
+    for col in df.columns:
+        kind = clean_df_data.type_of_column(col)
+        if kind != 'string':
+            df[col].map(lambda x: clean_df_data.clean_value(x, date_format=(kind == 'date')))
+
+
+def _clean_series(df, tmp_dir):
+    # clean_df_data: 고유값마다 clean_value 한 번 (factorize-then-parse)
+    import clean_df_data
+    for col in df.columns:
+        kind = clean_df_data.type_of_column(col)
+        if kind != 'string':
+            clean_df_data.clean_series(df[col], date_format=(kind == 'date'))
+
+
+def _clean_dataframe(df, tmp_dir):
+    from clean_df_data_vertor import clean_dataframe
+    clean_dataframe(df, workers=1)
+
+
+def _clean_dataframe_unique(df, tmp_dir):
+    from clean_df_data_vertor import clean_dataframe
+    clean_dataframe(df, workers=1, unique=True)
+
+
+def _clean_dataframe_pyarrow(df, tmp_dir):
+    from clean_df_data_vertor import clean_dataframe
+    clean_dataframe(df, workers=1, engine='pyarrow')
+
+
+def _clean_date_column(df, tmp_dir):
+    from clean_date_col import clean_date_column
+    clean_date_column(df[['reg_dtm']], 'reg_dtm')
+
+
+def _summarize(df, tmp_dir):
+    from summarize_dataframe import summarize_dataframe
+    summarize_dataframe(df)
+
+
+def _normalize_numbers(wine, tmp_dir):
+    from tab2formatted import normalize_numbers
+    normalize_numbers(wine, thousands='.', decimal=',', currency_symbols=['R$'])
+
+
+def _write_tab(wine, tmp_dir):
+    path = os.path.join(tmp_dir, 'bench.tsv')
+    wine.to_csv(path, sep='\t', index=False)
+    return path
+
+
+def _tab_conversion(tab_file, tmp_dir):
+    from tab2formatted import tab_to_csv_json_py
+    tab_to_csv_json_py(tab_file)
+
+
+def _write_csv(wine, tmp_dir):
+    path = os.path.join(tmp_dir, 'bench.csv')
+    wine.to_csv(path, index=False)
+    return path
+
+
+def _fit_csv(csv_file, tmp_dir):
+    from linear_regression import fit_csv, WINE_ALCOHOL_FORMAT
+    fit_csv(csv_file, target='quality', test_size=0.2, number_formats={'alcohol': WINE_ALCOHOL_FORMAT})
+
+
+def _numeric_values(wine, tmp_dir):
+    return wine.drop(columns='alcohol').astype('float64').to_numpy()
+
+
+def _to_string_list(values, tmp_dir):
+    from to_string_list import to_string_list
+    to_string_list(values, flatten=True, keep_none=False)
+
+
+def _print2pdf(df, tmp_dir):
+    from print2pdf import printer
+    # 폰트는 print2pdf.FONT_DIRS 에서 검색 (PRINT2PDF_FONT_PATH 환경 변수로 폴더 지정 가능), 없으면 error 로 기록
+    printer(df, pdf_filename=os.path.join(tmp_dir, 'bench.pdf'), print_backend='file')
+
+
+# name -> (dataset, func, prepare, max_rows)
+STAGES = {
+    'clean_df_data.scalar': ('dirty', _clean_scalar, None, 100_000),
+    'clean_df_data.clean_series': ('dirty', _clean_series, None, 1_000_000),
+    'clean_dataframe': ('dirty', _clean_dataframe, None, None),
+    'clean_dataframe.unique': ('dirty', _clean_dataframe_unique, None, None),
+    'clean_dataframe.pyarrow': ('dirty', _clean_dataframe_pyarrow, None, None),
+    'clean_date_column': ('dirty', _clean_date_column, None, None),
+    'summarize_dataframe': ('dirty', _summarize, None, None),
+    'tab2formatted.normalize_numbers': ('wine', _normalize_numbers, None, None),
+    'tab2formatted.tab_to_csv_json_py': ('wine', _tab_conversion, _write_tab, 1_000_000),
+    'to_string_list': ('wine', _to_string_list, _numeric_values, None),
+    'linear_regression.fit_csv': ('wine', _fit_csv, _write_csv, None),
+    'print2pdf.printer': ('dirty', _print2pdf, None, 100_000),
+}
+
+
+# -------------------------------------------------
+# Runner
+
+def _git_commit():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                check=True, cwd=os.path.dirname(WINE_CSV)).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], capture_output=True,
+                               text=True, cwd=os.path.dirname(WINE_CSV)).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _call(func, arg, tmp_dir, quiet):
+    # 단계 함수의 [INFO]/완료 출력과 pandas 경고는 측정 결과 출력과 섞이지 않게 버림
+    with contextlib.ExitStack() as stack:
+        if quiet:
+            stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+            stack.enter_context(warnings.catch_warnings())
+            warnings.simplefilter('ignore')
+        return func(arg, tmp_dir)
+
+
+def run_stage(name, data, rows, memory=True, quiet=True):
+    """
+    단계 하나를 실행하고 측정 결과 dict 반환.
+    status: 'ok', 'skipped'(max_rows 초과), 'error'(예외, 메시지는 error 에)
+    """
+    _, func, prepare, max_rows = STAGES[name]
+    result = {'stage': name, 'rows': rows, 'seconds': None, 'rows_per_sec': None, 'peak_mb': None, 'status': 'ok'}
+    if max_rows is not None and rows > max_rows:
+        result['status'] = 'skipped'
+        return result
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            arg = _call(prepare, data, tmp_dir, quiet) if prepare is not None else data
+            start = time.perf_counter()
+            _call(func, arg, tmp_dir, quiet)
+            result['seconds'] = round(time.perf_counter() - start, 4)
+            result['rows_per_sec'] = round(rows / result['seconds'], 1) if result['seconds'] > 0 else None
+            if memory:
+                tracemalloc.start()
+                try:
+                    _call(func, arg, tmp_dir, quiet)
+                    result['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+                finally:
+                    tracemalloc.stop()
+    except Exception as e:
+        result.update(status='error', error=f"{type(e).__name__}: {e}")
+    return result
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, stages=None, bad_rate=0.05, memory=True, output=None, seed=0):
+    """
+    sizes x stages 벤치마크를 실행하고 결과를 JSON 으로 저장.
+
+    Parameters:
+        sizes (Iterable[int]): 행 수 목록
+        stages (Iterable[str] | None): 실행할 단계 이름 (None 이면 STAGES 전체)
+        bad_rate (float): make_dirty_frame 의 깨진 값 비율
+        memory (bool): tracemalloc 으로 peak memory 도 측정 (단계를 한 번 더 실행)
+        output (str | None): 결과 JSON 경로. None 이면 benchmark_results/<시각>_<commit>.json
+        seed (int): 합성 데이터 seed
+
+    Returns:
+        dict: {'meta': 실행 환경, 'results': [단계별 측정 결과]}
+    """
+    stages = list(stages) if stages else list(STAGES)
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {unknown}. Available: {list(STAGES)}")
+
+    commit = _git_commit()
+    meta = {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'bad_rate': bad_rate,
+        'seed': seed,
+    }
+    results = []
+    for rows in sizes:
+        datasets = {}
+        for name in stages:
+            dataset = STAGES[name][0]
+            if dataset not in datasets:
+                start = time.perf_counter()
+                datasets[dataset] = (make_dirty_frame(rows, bad_rate, seed=seed) if dataset == 'dirty'
+                                     else make_wine_frame(rows))
+                print(f"[INFO] {dataset} {rows:,} rows 생성 {time.perf_counter() - start:.2f}s")
+            result = run_stage(name, datasets[dataset], rows, memory=memory)
+            results.append(result)
+            if result['status'] == 'ok':
+                peak = f"{result['peak_mb']:,.1f} MB" if result['peak_mb'] is not None else '-'
+                print(f"{name:34s} {rows:>12,} rows {result['seconds']:10.3f}s "
+                      f"{result['rows_per_sec']:>14,.0f} rows/sec  peak {peak}")
+            else:
+                print(f"{name:34s} {rows:>12,} rows {result['status']} {result.get('error', '')}")
+        del datasets
+
+    if output is None:
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        output = os.path.join(RESULT_DIR, f"{stamp}_{commit or 'nogit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    report = {'meta': meta, 'results': results}
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"✅ 벤치마크 저장 완료: {output}")
+    return report
+
+
+def compare_results(base_path, new_path):
+    """
+    두 결과 JSON 의 (stage, rows) 별 시간 비교표. speedup > 1 이면 new 가 빠름.
+    """
+    frames = []
+    for label, path in (('base', base_path), ('new', new_path)):
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+        frame = pd.DataFrame(report['results'])
+        frame = frame[frame['status'] == 'ok'][['stage', 'rows', 'seconds', 'peak_mb']]
+        frames.append(frame.rename(columns={'seconds': f'{label}_s', 'peak_mb': f'{label}_peak_mb'}))
+    table = frames[0].merge(frames[1], on=['stage', 'rows'], how='outer')
+    table['speedup'] = (table['base_s'] / table['new_s']).round(2)
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark each processing stage on synthetic data.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="row counts")
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), help="stages to run (default: all)")
+    parser.add_argument('--bad-rate', type=float, default=0.05, help="share of bad/null tokens per column")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc peak-memory run")
+    parser.add_argument('--output', help="result JSON path")
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'), help="compare two result JSON files")
+    args = parser.parse_args()
+
+    if args.compare:
+        print(compare_results(*args.compare).to_string(index=False))
+        sys.exit(0)
+    run_benchmarks(args.sizes, args.stages, bad_rate=args.bad_rate, memory=not args.no_memory, output=args.output)
@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+from parse_cache import ParseCache, parse_unique
+from null_tokens import NullTokenMatcher
 
 """
 Last updated: 2025-06-13 22:00:00
@@ -12,6 +14,7 @@ Last updated: 2025-06-13 22:00:00
 
 # user-defined filter and format
 filter_bad_value = ["", "none", "null", "nan", "-", "*"]
+bad_value_matcher = NullTokenMatcher(filter_bad_value)    # rebuild if filter_bad_value changes
 filter_date = ['%Y%m%d%H%M%S', '%Y%m%d', '%Y%m', None]     # None for fallback
 filter_column_name = {
     'numeric': ['_no', '_amt', '_rat'],
@@ -28,7 +31,7 @@ def clean_value(val, date_format=False):
         return pd.NaT if date_format else np.nan
     if isinstance(val, str):
         val = val.strip()
-        if val.lower() in [v.lower() for v in filter_bad_value]:
+        if val in bad_value_matcher:
             return pd.NaT if date_format else np.nan
     if date_format:        
         for fmt in filter_date:
@@ -44,6 +47,15 @@ def clean_value(val, date_format=False):
     except Exception:
         return val
 
+def clean_series(series, date_format=False, cache=None):
+    """
+    Apply clean_value to each distinct value only once (factorize-then-parse).
+    Pass a shared ParseCache to reuse parsed values across columns and DataFrames.
+    """
+    def parse(values):
+        return values.map(lambda x: clean_value(x, date_format=date_format)).infer_objects()
+    return parse_unique(series, parse, 'clean_value.date' if date_format else 'clean_value.numeric', cache)
+
 def type_of_column(col):
     lname = col.lower()
     for dtype in ['date', 'numeric']:
@@ -64,16 +76,18 @@ if __name__ == "__main__":
         'col_str2': ['a', '-', 'c', 2, '&&7']
     })
     df_list = [df1, df2]
+    cache = ParseCache(maxsize=10_000)
     for idx, dfi in enumerate(df_list):
         col_type_map = {col: type_of_column(col) for col in dfi.columns}
         if len(set(dfi.columns)) != len(set(col_type_map)):
             print(f"WARNING: column filtering has issue in df{idx}")
         for col, dtype in col_type_map.items():
             if dtype == 'numeric':
-                dfi[col] = dfi[col].apply(clean_value)
+                dfi[col] = clean_series(dfi[col], cache=cache)
             elif dtype == 'date':
-                dfi[col] = dfi[col].apply(lambda x: clean_value(x, date_format=True))
+                dfi[col] = clean_series(dfi[col], date_format=True, cache=cache)
             else:
                 dfi[col] = dfi[col].replace(filter_bad_value, np.nan)
     print(df1)
     print(df2)
+    print(cache.info())
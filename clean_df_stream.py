@@ -0,0 +1,120 @@
+import os
+import time
+import pandas as pd
+from clean_df_data_vertor import clean_dataframe, type_of_column
+
+"""
+메모리보다 큰 CSV/TSV 파일을 chunk 단위로 읽어 정제하고, 결과를 CSV/Parquet 으로 순차 저장한다.
+peak memory 는 chunk 크기에 비례한다(파일 전체를 메모리에 올리지 않음).
+
+1. iter_clean_chunks(): 파일을 chunksize 행씩 읽어 type_of_column 기준으로 정제한 DataFrame 을 yield (generator).
+2. write_chunks(): DataFrame iterable 을 받아 CSV 또는 Parquet 파일에 이어 쓰고 rows/sec 를 보고.
+3. clean_file(): 1 + 2 를 한 번에 실행.
+
+chunks = iter_clean_chunks('extract.tsv', chunksize=500_000)
+chunks = (c[c['col_amt'] > 0] for c in chunks)      # 추가 stage 연결 가능
+write_chunks(chunks, 'extract_cleaned.parquet')
+"""
+
+
+def _column_dtypes(columns):
+    # numeric is always float64 so every chunk has the same schema (NaN in one chunk, not in another)
+    return {col: {'numeric': 'float64', 'date': 'datetime64[s]'}.get(type_of_column(col), 'object') for col in columns}
+
+
+def iter_clean_chunks(src, chunksize=500_000, sep=None, workers=1, backend='thread', **read_csv_kwargs):
+    """
+    Read a CSV/TSV file in chunks and yield each chunk cleaned by clean_dataframe.
+
+    Parameters:
+        src (str): Input file path. '.tsv'/'.tab'/'.txt' files default to TAB separator.
+        chunksize (int): Rows per chunk.
+        sep (str | None): Field separator; None infers it from the file extension.
+        workers (int): Pool size passed to clean_dataframe for each chunk.
+        backend (str): 'thread' or 'process', passed to clean_dataframe.
+        **read_csv_kwargs: Extra arguments for pd.read_csv (e.g. encoding, usecols).
+
+    Yields:
+        pd.DataFrame: Cleaned chunk with numeric columns as float64, date columns as datetime64[s].
+    """
+    if sep is None:
+        sep = '\t' if os.path.splitext(src)[1].lower() in ('.tsv', '.tab', '.txt') else ','
+    read_csv_kwargs.setdefault('dtype', str)
+    with pd.read_csv(src, sep=sep, chunksize=chunksize, **read_csv_kwargs) as reader:
+        for chunk in reader:
+            cleaned = clean_dataframe(chunk, workers=workers, backend=backend)
+            yield cleaned.astype(_column_dtypes(cleaned.columns))
+
+
+def write_chunks(chunks, dst, fmt=None, encoding='utf-8-sig'):
+    """
+    Write an iterable of DataFrames to one CSV or Parquet file incrementally.
+
+    Parameters:
+        chunks (Iterable[pd.DataFrame]): Chunks with identical columns (e.g. from iter_clean_chunks).
+        dst (str): Output file path.
+        fmt (str | None): 'csv' or 'parquet'; None infers it from the file extension.
+        encoding (str): CSV encoding.
+
+    Returns:
+        dict: {'rows', 'chunks', 'seconds', 'rows_per_sec'}
+    """
+    fmt = fmt or ('parquet' if os.path.splitext(dst)[1].lower() in ('.parquet', '.pq') else 'csv')
+    if fmt not in ('csv', 'parquet'):
+        raise ValueError(f"Unsupported output format: '{fmt}'. Use 'csv' or 'parquet'.")
+
+    rows = n_chunks = 0
+    start = time.perf_counter()
+    writer = None
+    try:
+        if fmt == 'csv':
+            writer = open(dst, 'w', encoding=encoding, newline='')
+        for chunk in chunks:
+            if fmt == 'csv':
+                chunk.to_csv(writer, index=False, header=(n_chunks == 0))
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                if writer is None:
+                    # all-null object columns in the first chunk would otherwise become a null-typed field
+                    schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                    for i, field in enumerate(schema):
+                        if pa.types.is_null(field.type):
+                            schema = schema.set(i, field.with_type(pa.string()))
+                    writer = pq.ParquetWriter(dst, schema)
+                writer.write_table(pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False))
+            rows += len(chunk)
+            n_chunks += 1
+            elapsed = time.perf_counter() - start
+            print(f"[INFO] chunk {n_chunks}: {rows:,} rows ({rows / elapsed if elapsed > 0 else 0:,.0f} rows/sec)")
+    finally:
+        if writer is not None:
+            writer.close()
+
+    elapsed = time.perf_counter() - start
+    stats = {
+        'rows': rows,
+        'chunks': n_chunks,
+        'seconds': round(elapsed, 3),
+        'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else None,
+    }
+    print(f"✅ 저장 완료: {dst} ({rows:,} rows, {stats['rows_per_sec']} rows/sec)")
+    return stats
+
+
+def clean_file(src, dst, chunksize=500_000, sep=None, fmt=None, workers=1, backend='thread', **read_csv_kwargs):
+    """
+    Stream-clean `src` into `dst` with bounded memory. See iter_clean_chunks / write_chunks.
+    """
+    chunks = iter_clean_chunks(src, chunksize=chunksize, sep=sep, workers=workers, backend=backend, **read_csv_kwargs)
+    return write_chunks(chunks, dst, fmt=fmt)
+
+
+if __name__ == "__main__":
+    import sys
+
+    # python clean_df_stream.py <input.csv|.tsv> <output.csv|.parquet> [chunksize]
+    if len(sys.argv) < 3:
+        print("usage: python clean_df_stream.py <input> <output> [chunksize]")
+        sys.exit(1)
+    clean_file(sys.argv[1], sys.argv[2], chunksize=int(sys.argv[3]) if len(sys.argv) > 3 else 500_000)
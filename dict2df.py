@@ -1,48 +1,80 @@
+import os
+import importlib
 import pandas as pd
 import numpy as np
 from tabulate import tabulate
 import print2pdf
+from union_sort import union_sort, export_csv
 
-# 저장된 Python 딕셔너리 데이터를 가져오기
-import table_converted_python_dict
-import table2_converted_python_dict
-import table3_converted_python_dict
-import table4_converted_python_dict
-
-# 각 모듈에서 dict 속성을 가져와서 Python 딕셔너리로 저장
-dict1 = table_converted_python_dict.dict
-dict2 = table2_converted_python_dict.dict
-dict3 = table3_converted_python_dict.dict
-dict4 = table4_converted_python_dict.dict
-
-# 각 dictionanry를 DataFrame으로 변환
-df1 = pd.DataFrame.from_dict(dict1)
-df2 = pd.DataFrame.from_dict(dict2)
-df3 = pd.DataFrame.from_dict(dict3)
-df4 = pd.DataFrame.from_dict(dict4)
-
-# 특정 컬럼 삭제(inplace=True 원본에 반영)
-df4.drop(columns=['SEQ_NO'], inplace=True, errors='ignore')
-
-# 모든 dataframe을 하나로 합침(NaN 유지한 수직병합 - SQL의 UNION ALL과 동일)
-# ignore_index=True 옵션을 사용하여 인덱스를 재설정
-df = pd.concat([df1, df2, df3, df4], ignore_index=True)
-# object 타입 열 안에 있는 None 값을 명시적으로 np.nan으로 통일
-df = df.replace({None: np.nan})
-
-# 컬럼 값 기준으로 정렬
-# ignore_index=True 옵션을 사용하여 인덱스를 재설정
-df_sorted = df.sort_values(by=['시스템 명칭','테이블 ID'], ascending=[True, True], ignore_index=True)
-
-# 컬럼 출력 순서 재정의
+
+def load_converted(base, columns=None, arrow_dtype=False):
+    """
+    tab2formatted 변환 결과를 DataFrame 으로 로드.
+    '<base>_converted.feather' 가 있으면 memory-map 으로 읽고(비압축 Arrow IPC, zero-copy),
+    없으면 기존 '<base>_converted_python_dict' 모듈을 import 해서 사용.
+
+    두 경로의 결과는 같음 (같은 dtype, 같은 columns 처리).
+
+    Parameters:
+        base (str): 변환 전 TAB 파일 이름(확장자 제외), 예: 'table'
+        columns (list[str] | None): 읽을 컬럼, 지정한 순서대로. 파일에 없는 컬럼은 전부 결측인 컬럼으로 추가.
+        arrow_dtype (bool): True 이면 pd.ArrowDtype(string) 컬럼으로 반환 (Feather 는 Arrow 메모리를 그대로 사용, 복사 없음).
+            False 이면 object(str/None) 컬럼 (pandas 3 의 기본 str dtype 이 아님).
+
+    Returns:
+        pd.DataFrame
+    """
+    feather_file = f"{base}_converted.feather"
+    if os.path.exists(feather_file):
+        import pyarrow as pa
+        from pyarrow import feather
+        table = feather.read_table(feather_file, memory_map=True)
+        if columns is not None:
+            for col in columns:
+                if col not in table.column_names:
+                    table = table.append_column(col, pa.nulls(table.num_rows, pa.string()))
+            table = table.select(columns)
+        if arrow_dtype:
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        # to_pandas() 는 pandas 3 에서 str dtype -> .py 경로와 같은 object(str/None)
+        df = pd.DataFrame({i: col.to_numpy() for i, col in enumerate(table.columns)}, dtype=object)
+        df.columns = table.column_names
+        return df
+    module = importlib.import_module(f"{base}_converted_python_dict")
+    df = pd.DataFrame.from_dict(module.dict, dtype=object)
+    if columns is not None:
+        missing = [col for col in columns if col not in df.columns]
+        df = df.reindex(columns=columns).assign(**{col: None for col in missing})
+    if arrow_dtype:
+        import pyarrow as pa
+        df = df.astype(pd.ArrowDtype(pa.string()))
+    return df
+
+
+# 저장된 변환 결과(Feather, 없으면 Python 딕셔너리 모듈)를 DataFrame으로 가져오기
+df1 = load_converted('table')
+df2 = load_converted('table2')
+df3 = load_converted('table3')
+df4 = load_converted('table4')
+
+# 컬럼 출력 순서 재정의(병합 전에 적용하므로 df4 의 SEQ_NO 등 나머지 컬럼은 병합되지 않음)
 new_column_order = ['시스템 명칭', '테이블 ID', '표준 테이블 명칭', '컬럼 IT 명칭', '컬럼 명칭', '표준 컬럼 명칭', '전체 ROW 개수']
-df_reordered_sorted = df_sorted[new_column_order]
+
+# 모든 dataframe을 하나로 합치고(NaN 유지한 수직병합 - SQL의 UNION ALL과 동일) 컬럼 값 기준으로 정렬
+# object 타입 열 안에 있는 None 값은 np.nan으로 통일, 인덱스는 재설정됨
+# 메모리보다 큰 입력은 union_sort.iter_union_sort + export_csv 사용
+df_reordered_sorted = union_sort(
+    [df1, df2, df3, df4],
+    by=['시스템 명칭', '테이블 ID'],
+    ascending=[True, True],
+    columns=new_column_order
+    )
 # 결과 일부 출력(tabulate)
 table = tabulate(df_reordered_sorted[1500:1520], headers='keys', tablefmt='psql', numalign="left", showindex=False)
 print(table)
 
 # 최종 결과를 CSV 파일로 저장
-df_reordered_sorted.to_csv('reordered_sorted_combined_data.csv', encoding='utf-8-sig')
+export_csv(df_reordered_sorted, 'reordered_sorted_combined_data.csv', encoding='utf-8-sig')
 
 # numpy array 로 변환
 # nan 은 python 에 인식 가능한 None 으로 변경
@@ -59,5 +91,6 @@ print2pdf.printer(
     pagesize='A4',
     orientation='landscape',
     max_col_width=30,
-    line_height=8
+    line_height=8,
+    east_asian_width=True   # 한글 컬럼명/값을 2칸 폭으로 계산해 정렬
     )
\ No newline at end of file
@@ -0,0 +1,298 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:     # 없으면 고유값이 많은 텍스트 컬럼은 object 로 둠
+    pa = None
+
+"""
+정제(clean_dataframe / iter_clean_chunks) 후의 DataFrame 을 메모리가 적게 드는 dtype 으로 바꾸는 단계.
+type_of_column 기준 정제 결과는 numeric 이 float64, string 이 object 라서 넓은 추출 파일에서 메모리를 많이 씀.
+
+1. plan_dtypes(): 컬럼별 목표 dtype 계획(dict)을 만듦. 값은 바꾸지 않음.
+   - 정수: 값 범위에 맞는 가장 작은 int/uint
+   - float: 모든 값이 정수이면 (nullable) 정수, float32 로 손실 없이 표현되면 float32 (lossy_float32=True 이면 항상)
+   - 텍스트: 고유값 비율이 category_ratio 이하이면 category, 아니면 string[pyarrow]
+   - Python date/datetime 객체 (예: clean_date_column 의 PARSED_DATE): date 는 datetime64[s], datetime 은 datetime64[us]
+     (ns 값이 있는 Timestamp 가 섞이면 datetime64[ns]). ns 범위(1677~2262년) 밖 날짜도 그대로, tz-aware 값이 있으면 계획하지 않음.
+2. apply_dtype_plan(): 계획을 적용 (같은 계획을 여러 DataFrame 에 재사용 가능).
+3. memory_report(): 변환 전후 memory_usage(deep=True) 비교표.
+4. optimize_dtypes(): 1~3 을 한 번에 실행하고 보고 (category 는 factorize 결과를 재사용).
+
+df_small = clean_dataframe(df).pipe(optimize_dtypes)
+"""
+
+INT_TYPES = ('int8', 'int16', 'int32', 'int64')
+UINT_TYPES = ('uint8', 'uint16', 'uint32', 'uint64')
+
+# float64 가 정수를 정확히 표현하는 범위 (이보다 크면 정수 변환하지 않음)
+_MAX_EXACT_INT = 2 ** 53
+
+
+def _smallest_int(min_val, max_val, nullable=False):
+    """min_val~max_val 을 담는 가장 작은 정수 dtype 이름 (nullable 이면 'Int8' 같은 pandas nullable dtype)"""
+    candidates = UINT_TYPES if min_val >= 0 else INT_TYPES
+    for name in candidates:
+        info = np.iinfo(name)
+        if info.min <= min_val and max_val <= info.max:
+            return name.capitalize().replace('Ui', 'UI') if nullable else name
+    return None
+
+
+def _itemsize(name):
+    return np.dtype(name.lower()).itemsize
+
+
+def _plan_float(values, lossy_float32):
+    """float 배열(NaN 포함 가능)의 목표 dtype. 바꿀 필요가 없으면 None."""
+    valid = values[~np.isnan(values)]
+    has_nan = len(valid) < len(values)
+    if len(valid) == 0:
+        return 'float32'
+    if np.isfinite(valid).all():
+        lo, hi = valid.min(), valid.max()
+        if -_MAX_EXACT_INT <= lo and hi <= _MAX_EXACT_INT and np.array_equal(valid, np.trunc(valid)):
+            target = _smallest_int(int(lo), int(hi), nullable=has_nan)
+            if target is not None and _itemsize(target) < values.dtype.itemsize:
+                return target
+    if values.dtype == np.float32:
+        return None
+    if lossy_float32 or np.array_equal(valid.astype(np.float32).astype(valid.dtype), valid):
+        return 'float32'
+    return None
+
+
+def _plan_datetime(series, kind):
+    """
+    date/datetime 객체 컬럼의 목표 dtype. tz-aware 값이 있거나 변환할 수 없으면 None (계획하지 않음).
+    """
+    if kind == 'date':
+        target = 'datetime64[s]'
+    else:
+        # Python datetime 은 us 정밀도. ns 단위 값이 있는 Timestamp / np.datetime64 가 섞였을 때만 ns
+        fine = any(pd.Timestamp(v).nanosecond for v in series.dropna() if type(v) is not datetime)
+        target = 'datetime64[ns]' if fine else 'datetime64[us]'
+    try:
+        series.astype(target)
+    except (ValueError, TypeError, OverflowError):     # tz-aware, 범위 밖 (OutOfBoundsDatetime 은 ValueError)
+        return None
+    return target
+
+
+def _plan_object(series, category_ratio, text_dtype):
+    """
+    object / 문자열 컬럼의 (목표 dtype, factorize 결과). category 가 아니면 factorize 결과는 None.
+    """
+    kind = pd.api.types.infer_dtype(series, skipna=True)
+    if kind in ('date', 'datetime', 'datetime64'):
+        return _plan_datetime(series, kind), None
+    if kind not in ('string', 'mixed', 'mixed-integer', 'empty') and not isinstance(series.dtype, pd.StringDtype):
+        return None, None
+
+    codes, uniques = pd.factorize(series)
+    count = int((codes >= 0).sum())
+    if count and len(uniques) <= category_ratio * count:
+        return 'category', (codes, uniques)
+    if kind == 'string' and text_dtype is not None:
+        storage = getattr(series.dtype, 'storage', None)
+        # pandas 3 의 기본 str dtype 은 이미 pyarrow 저장소 (바꿔도 메모리 이득 없음)
+        if storage != 'pyarrow':
+            return text_dtype, None
+    return None, None
+
+
+def _plan_column(series, category_ratio, lossy_float32, text_dtype):
+    """컬럼 하나의 (목표 dtype 또는 None, category 용 factorize 결과 또는 None)"""
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return None, None
+    if pd.api.types.is_integer_dtype(dtype):
+        if len(series) == 0 or series.isna().all():
+            return None, None
+        target = _smallest_int(int(series.min()), int(series.max()),
+                               nullable=pd.api.types.is_extension_array_dtype(dtype))
+        return (target if target is not None and _itemsize(target) < dtype.itemsize else None), None
+    if pd.api.types.is_float_dtype(dtype):
+        if pd.api.types.is_extension_array_dtype(dtype):
+            values = series.to_numpy(dtype='float64', na_value=np.nan)
+        else:
+            values = series.to_numpy()
+        target = _plan_float(values, lossy_float32)
+        return (target if target != str(dtype) else None), None
+    if dtype == object or pd.api.types.is_string_dtype(dtype):
+        return _plan_object(series, category_ratio, text_dtype)
+    return None, None
+
+
+def _default_text_dtype():
+    return 'string[pyarrow]' if pa is not None else None
+
+
+def plan_dtypes(df, category_ratio=0.5, lossy_float32=False, text_dtype='auto'):
+    """
+    정제된 DataFrame 의 컬럼별 목표 dtype 계획을 만듦 (바꿀 필요가 없는 컬럼은 제외).
+
+    Parameters:
+        df (pd.DataFrame): 정제된 DataFrame
+        category_ratio (float): 고유값 수 / null 이 아닌 값 수 가 이 비율 이하인 텍스트 컬럼은 category
+        lossy_float32 (bool): True 이면 정수가 아닌 float 컬럼을 정밀도 손실을 감수하고 float32 로
+        text_dtype (str | None): 고유값이 많은 텍스트 컬럼의 dtype. 'auto' 는 pyarrow 가 있으면 'string[pyarrow]',
+            None 이면 object 유지
+
+    Returns:
+        dict: {컬럼명: dtype 이름}. 이름이 중복된 컬럼은 모든 위치의 계획이 같을 때만 포함.
+    """
+    if text_dtype == 'auto':
+        text_dtype = _default_text_dtype()
+    plan, conflicts = {}, set()
+    for pos, col in enumerate(df.columns):
+        target, _ = _plan_column(df.iloc[:, pos], category_ratio, lossy_float32, text_dtype)
+        if col in plan and plan[col] != target:
+            conflicts.add(col)
+        plan[col] = target
+    return {col: target for col, target in plan.items() if target is not None and col not in conflicts}
+
+
+def _convert(series, target, factorized=None):
+    if target == 'category' and factorized is not None:
+        codes, uniques = factorized
+        return pd.Series(pd.Categorical.from_codes(codes, categories=uniques), index=series.index, name=series.name)
+    return series.astype(target)
+
+
+def apply_dtype_plan(df, plan):
+    """
+    plan_dtypes() 의 계획을 적용한 새 DataFrame 을 반환 (계획에 없는 컬럼은 그대로).
+    다른 chunk 에 재사용할 때 값이 정수 범위를 넘으면 astype 과 같은 오류가 남.
+    """
+    if not plan:
+        return df.copy(deep=False)
+    columns = [_convert(df.iloc[:, pos], plan[col]) if col in plan else df.iloc[:, pos]
+               for pos, col in enumerate(df.columns)]
+    result = pd.concat(columns, axis=1)
+    result.columns = df.columns
+    return result
+
+
+def memory_report(before, after):
+    """
+    변환 전후 컬럼별 dtype 과 memory_usage(deep=True) 비교표. 마지막 행은 index 를 포함한 합계.
+    """
+    bytes_before = before.memory_usage(deep=True, index=False).to_numpy()
+    bytes_after = after.memory_usage(deep=True, index=False).to_numpy()
+    report = pd.DataFrame({
+        'Column': [str(c) for c in before.columns],
+        'Dtype Before': [str(t) for t in before.dtypes],
+        'Dtype After': [str(t) for t in after.dtypes],
+        'Bytes Before': bytes_before,
+        'Bytes After': bytes_after,
+    })
+    total = pd.DataFrame({
+        'Column': ['(total)'], 'Dtype Before': [''], 'Dtype After': [''],
+        'Bytes Before': [int(before.memory_usage(deep=True).sum())],
+        'Bytes After': [int(after.memory_usage(deep=True).sum())],
+    })
+    report = pd.concat([report, total], ignore_index=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        report['Saved %'] = np.round(100 * (1 - report['Bytes After'] / report['Bytes Before']), 1)
+    return report
+
+
+def optimize_dtypes(df, category_ratio=0.5, lossy_float32=False, text_dtype='auto', verbose=True):
+    """
+    plan_dtypes + apply_dtype_plan 을 한 번에 (category 컬럼은 계획할 때의 factorize 결과로 바로 만듦).
+    DataFrame.pipe 로 정제 단계 뒤에 연결해서 사용.
+
+    Parameters:
+        df (pd.DataFrame): 정제된 DataFrame
+        category_ratio, lossy_float32, text_dtype: plan_dtypes 참고
+        verbose (bool): 변환 전후 메모리 사용량 출력
+
+    Returns:
+        pd.DataFrame: dtype 을 바꾼 새 DataFrame. attrs['dtype_plan'] 에 적용한 계획, attrs['memory_report'] 에 비교표.
+    """
+    if text_dtype == 'auto':
+        text_dtype = _default_text_dtype()
+    plan, columns = {}, []
+    for pos, col in enumerate(df.columns):
+        series = df.iloc[:, pos]
+        target, factorized = _plan_column(series, category_ratio, lossy_float32, text_dtype)
+        if target is None:
+            columns.append(series)
+            continue
+        plan[col] = target
+        columns.append(_convert(series, target, factorized))
+
+    if columns:
+        result = pd.concat(columns, axis=1)
+        result.columns = df.columns
+    else:
+        result = df.copy(deep=False)
+    report = memory_report(df, result)
+    result.attrs['dtype_plan'] = plan
+    result.attrs['memory_report'] = report
+
+    if verbose:
+        total = report.iloc[-1]
+        print(f"[INFO] dtype 변경 {len(plan)}/{df.shape[1]}개 컬럼: "
+              f"{total['Bytes Before'] / 2**20:,.1f} MB -> {total['Bytes After'] / 2**20:,.1f} MB "
+              f"({total['Saved %']}% 절감)")
+    return result
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from datetime import date, timezone
+    from clean_df_data_vertor import clean_dataframe
+
+    # python dtype_planner.py [rows]  (default 1,000,000)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    raw = pd.DataFrame({
+        'seq_no': np.arange(n).astype(str),
+        'qty_amt': rng.integers(0, 500, n).astype(str),
+        'price_amt': np.round(rng.normal(100, 20, n), 2).astype(str),
+        'rate_rat': rng.choice(['0.5', '0.25', '-', '1'], n),
+        'branch_nm': rng.choice([f"지점{i:03d}" for i in range(200)], n),
+        'memo': [f"memo {i}" for i in range(n)],
+    })
+    raw.loc[rng.random(n) < 0.05, 'qty_amt'] = 'null'
+
+    start = time.perf_counter()
+    cleaned = clean_dataframe(raw, workers=1)
+    cleaned['PARSED_DATE'] = pd.Series([date(2024, 1, 1 + i % 28) for i in range(n)], dtype=object)
+    print(f"[INFO] clean_dataframe {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    optimized = cleaned.pipe(optimize_dtypes)
+    print(f"[INFO] optimize_dtypes {time.perf_counter() - start:.2f}s")
+    print(optimized.attrs['memory_report'].to_string(index=False))
+
+    # 값은 그대로인지 확인 (category/string 은 object 로, nullable 정수는 float 로 되돌려 비교)
+    for col in cleaned.columns:
+        restored = optimized[col]
+        if isinstance(restored.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(restored.dtype):
+            same = restored.astype(object).where(restored.notna(), None).equals(cleaned[col].astype(object).where(cleaned[col].notna(), None))
+        elif pd.api.types.is_datetime64_any_dtype(restored.dtype):
+            same = restored.equals(cleaned[col].astype(restored.dtype))
+        else:
+            same = np.array_equal(restored.to_numpy(dtype='float64', na_value=np.nan),
+                                  cleaned[col].to_numpy(dtype='float64'), equal_nan=True)
+        print(f"{col:12s} {'OK' if same else 'MISMATCH'}")
+
+    # ns 범위 밖 날짜 / tz-aware 값: 범위 밖은 datetime64[s]/[us] 로 그대로, tz-aware 는 계획하지 않음
+    edge = pd.DataFrame({
+        'far_date': pd.Series([date(1, 1, 1), date(9999, 12, 31), None], dtype=object),
+        'far_datetime': pd.Series([datetime(1, 1, 1, 0, 0, 0, 1), datetime(9999, 12, 31, 23, 59, 59), None], dtype=object),
+        'tz_datetime': pd.Series([datetime(2025, 3, 1, tzinfo=timezone.utc), datetime(2025, 3, 2, tzinfo=timezone.utc), None], dtype=object),
+    })
+    edge_plan = plan_dtypes(edge)
+    print(f"[INFO] edge plan: {edge_plan}")
+    restored = apply_dtype_plan(edge, edge_plan)
+    for col, target in edge_plan.items():
+        same = restored[col].iloc[:2].tolist() == [pd.Timestamp(v) for v in edge[col].iloc[:2]]
+        print(f"{col:12s} {'OK' if same else 'MISMATCH'}")
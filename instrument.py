@@ -0,0 +1,279 @@
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+
+"""
+단계별 계측(opt-in). recording() 블록 안에서만 기록하고, 밖에서는 stage()/instrumented 가 거의 비용 없이 통과.
+tab_to_csv_json_py, batch_process, clean_dataframe / clean_column, summarize_dataframe, printer, fit_csv 가 사용함.
+
+기록 항목(단계 1회당 1건): stage, parent(바깥 단계), column, file, rows, bytes_read, bytes_written,
+wall_s, peak_mb(단계 중 tracemalloc peak - 시작 시점 사용량, memory=True 일 때), error, pid, thread, 추가 항목.
+
+with recording(memory=True, path='run_report.json') as rec:
+    batch_process('jobfilelist.txt')
+print(rec.summary())
+
+- structured log: recording(log=True) 이면 단계가 끝날 때마다 'instrument' logger 로 JSON 한 줄 출력
+- thread pool 안의 단계도 같은 recorder 에 기록. process pool 자식의 기록은 batch_process 처럼 결과와 함께
+  돌려받아 extend() 로 합쳐야 함(clean_dataframe(backend='process'), printer(workers>1) 의 자식 단계는 남지 않음).
+"""
+
+logger = logging.getLogger('instrument')
+
+# 현재 활성 recorder (module global 이라 thread pool 작업에서도 보임)
+_recorder = None
+# thread 별 열린 단계 stack (parent 이름, peak memory 전파용)
+_local = threading.local()
+
+
+class Stage:
+    """열린 단계. with stage(...) as st: 안에서 st.add(rows=..., bytes_written=...) 로 수치 누적."""
+    __slots__ = ('name', 'column', 'file', 'rows', 'bytes_read', 'bytes_written', 'extra', '_base', '_peak')
+
+    def __init__(self, name, rows=None, column=None, file=None, extra=None):
+        self.name = name
+        self.column = column
+        self.file = file
+        self.rows = rows
+        self.bytes_read = None
+        self.bytes_written = None
+        self.extra = extra or {}
+        self._base = self._peak = 0
+
+    def add(self, rows=None, bytes_read=None, bytes_written=None):
+        if rows is not None:
+            self.rows = (self.rows or 0) + rows
+        if bytes_read is not None:
+            self.bytes_read = (self.bytes_read or 0) + bytes_read
+        if bytes_written is not None:
+            self.bytes_written = (self.bytes_written or 0) + bytes_written
+
+    def set(self, **extra):
+        self.extra.update(extra)
+
+
+class _NullStage:
+    """계측이 꺼져 있을 때 stage() 가 돌려주는 no-op"""
+    __slots__ = ()
+
+    def add(self, rows=None, bytes_read=None, bytes_written=None):
+        pass
+
+    def set(self, **extra):
+        pass
+
+
+NULL_STAGE = _NullStage()
+_NULL_CONTEXT = nullcontext(NULL_STAGE)
+
+
+class Recorder:
+    """
+    recording() 이 만드는 기록 저장소.
+
+    Attributes:
+        records (list[dict]): 끝난 단계 기록 (끝난 순서)
+        memory (bool): tracemalloc 으로 단계별 peak memory 측정
+        log (bool): 단계가 끝날 때마다 'instrument' logger 로 JSON 한 줄 출력
+    """
+
+    def __init__(self, memory=False, log=False):
+        self.records = []
+        self.memory = memory
+        self.log = log
+        self.started = datetime.now().isoformat(timespec='seconds')
+        self._lock = threading.Lock()
+
+    def _add(self, record):
+        with self._lock:
+            self.records.append(record)
+        if self.log:
+            logger.info(json.dumps(record, ensure_ascii=False, default=str))
+
+    def extend(self, records):
+        """다른 프로세스에서 만든 기록(list[dict])을 합침"""
+        for record in records:
+            self._add(record)
+
+    def to_frame(self):
+        import pandas as pd
+        return pd.DataFrame(self.records)
+
+    def summary(self):
+        """단계별 합계: 횟수, wall_s, rows, bytes, 최대 peak_mb, rows/sec"""
+        import pandas as pd
+        frame = self.to_frame()
+        if frame.empty:
+            return pd.DataFrame(columns=['stage', 'calls', 'wall_s', 'rows', 'bytes_read', 'bytes_written',
+                                         'peak_mb', 'rows_per_sec'])
+        summary = frame.groupby('stage', sort=False).agg(
+            calls=('stage', 'size'), wall_s=('wall_s', 'sum'), rows=('rows', 'sum'),
+            bytes_read=('bytes_read', 'sum'), bytes_written=('bytes_written', 'sum'), peak_mb=('peak_mb', 'max'),
+        ).reset_index()
+        summary['rows_per_sec'] = (summary['rows'] / summary['wall_s']).where(summary['wall_s'] > 0).round(1)
+        return summary
+
+    def to_json(self, path):
+        """{'meta': ..., 'stages': records} 를 JSON 파일로 저장"""
+        report = {'meta': {'started': self.started, 'pid': os.getpid(), 'memory': self.memory},
+                  'stages': self.records}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        return path
+
+
+def enabled():
+    """recording() 블록 안이면 True"""
+    return _recorder is not None
+
+
+def current():
+    """활성 Recorder (계측이 꺼져 있으면 None)"""
+    return _recorder
+
+
+@contextmanager
+def recording(memory=False, log=False, path=None):
+    """
+    블록 안에서 실행되는 계측 단계를 기록.
+
+    Parameters:
+        memory (bool): tracemalloc 으로 단계별 peak memory 측정 (Python/NumPy heap 기준, 실행이 느려짐)
+        log (bool): 단계가 끝날 때마다 'instrument' logger 로 JSON 한 줄 출력
+        path (str | None): 블록이 끝날 때 JSON 보고서를 저장할 경로
+
+    Yields:
+        Recorder
+    """
+    global _recorder
+    previous = _recorder
+    rec = Recorder(memory=memory, log=log)
+    start_trace = memory and not tracemalloc.is_tracing()
+    if start_trace:
+        tracemalloc.start()
+    _recorder = rec
+    try:
+        yield rec
+    finally:
+        _recorder = previous
+        if start_trace:
+            tracemalloc.stop()
+        if path is not None:
+            rec.to_json(path)
+
+
+def _stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _push_peak(stack):
+    # 지금까지의 peak 를 열린 단계들에 반영하고 reset (안쪽 단계가 reset 해도 바깥 단계 peak 가 유지됨)
+    peak = tracemalloc.get_traced_memory()[1]
+    for open_stage in stack:
+        open_stage._peak = max(open_stage._peak, peak)
+    tracemalloc.reset_peak()
+    return peak
+
+
+@contextmanager
+def _record_stage(rec, st):
+    stack = _stack()
+    parent = stack[-1].name if stack else None
+    trace = rec.memory and tracemalloc.is_tracing()
+    if trace:
+        _push_peak(stack)
+        st._base = tracemalloc.get_traced_memory()[0]
+    stack.append(st)
+    error = None
+    start = time.perf_counter()
+    try:
+        yield st
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        wall = time.perf_counter() - start
+        stack.pop()
+        peak_mb = None
+        if trace and tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1], st._peak)
+            for open_stage in stack:
+                open_stage._peak = max(open_stage._peak, peak)
+            tracemalloc.reset_peak()
+            peak_mb = round((peak - st._base) / 2**20, 3)
+        rec._add({
+            'stage': st.name, 'parent': parent,
+            'column': None if st.column is None else str(st.column), 'file': st.file,
+            'rows': st.rows, 'bytes_read': st.bytes_read, 'bytes_written': st.bytes_written,
+            'wall_s': round(wall, 6), 'peak_mb': peak_mb, 'error': error,
+            'pid': os.getpid(), 'thread': threading.current_thread().name, **st.extra,
+        })
+
+
+def stage(name, rows=None, column=None, file=None, **extra):
+    """
+    단계 계측 context manager. 계측이 꺼져 있으면 공유 no-op 을 돌려줌(기록/시간 측정 없음).
+
+    with stage('write_csv', file=csv_file) as st:
+        ...
+        st.add(bytes_written=os.path.getsize(csv_file))
+    """
+    rec = _recorder
+    if rec is None:
+        return _NULL_CONTEXT
+    return _record_stage(rec, Stage(name, rows=rows, column=column, file=file, extra=extra))
+
+
+def _rows_of(value):
+    shape = getattr(value, 'shape', None)
+    return int(shape[0]) if shape else None
+
+
+def _column_of(value):
+    # pd.Series 의 name (DataFrame 의 .name 은 같은 이름의 컬럼일 수 있으므로 1차원만)
+    return getattr(value, 'name', None) if getattr(value, 'ndim', None) == 1 else None
+
+
+def instrumented(name=None):
+    """
+    함수 전체를 단계로 계측하는 decorator. 첫 인자가 DataFrame/Series/ndarray 이면 그 행 수를 rows 로,
+    Series 이면 name 을 column 으로 기록.
+    계측이 꺼져 있으면 global 확인 한 번만 하고 원래 함수를 호출.
+    """
+    def decorate(func):
+        stage_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            rec = _recorder
+            if rec is None:
+                return func(*args, **kwargs)
+            first = args[0] if args else None
+            with _record_stage(rec, Stage(stage_name, rows=_rows_of(first), column=_column_of(first))):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def file_size(path):
+    """bytes_read/bytes_written 용 파일 크기 (없으면 None)"""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def extend(records):
+    """활성 recorder 에 다른 프로세스의 기록을 합침 (계측이 꺼져 있으면 무시)"""
+    rec = _recorder
+    if rec is not None and records:
+        rec.extend(records)
@@ -0,0 +1,322 @@
+import os
+import itertools
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from clean_df_data_vertor import vectorized_clean_value_numeric
+from tab2formatted import normalize_number_column
+from instrument import stage, file_size
+
+"""
+메모리보다 큰 CSV 로 선형회귀(최소제곱, sklearn LinearRegression 과 같은 해)를 학습한다.
+파일을 chunk 단위로 읽어 프로젝트의 숫자 정제(vectorized_clean_value_numeric)를 거친 뒤,
+정규방정식의 충분통계량(XᵀX, Xᵀy)만 누적하므로 메모리는 chunk 크기 + (컬럼 수)² 로 일정하다.
+
+1. NormalEquationAccumulator: chunk 마다 update(), worker 결과는 merge(). 평균과 편차곱 합(co-moment)으로 저장해서
+   값이 큰 컬럼(density 등)에서도 XᵀX 의 자릿수 손실이 없다. solve() 로 계수/절편, score() 로 MSE/R².
+2. fit_chunks(): DataFrame chunk iterable 로 학습. test_size 만큼의 행은 test 누적기로 보내 같은 한 번의 읽기로
+   test MSE/R² 까지 계산 (split_mask 는 행 번호 hash 라 chunk 크기/worker 수와 무관하게 같은 행이 test).
+3. fit_csv(): CSV/TSV 파일을 읽으면서 fit_chunks.
+
+model = fit_csv('winequality-white.csv', target='quality', test_size=0.2,
+                number_formats={'alcohol': WINE_ALCOHOL_FORMAT})     # "R$ 45.512,00" -> 45512
+print(model['coef'], model['intercept'], model['test'])
+"""
+
+# winequality-white.csv 의 alcohol 컬럼 형식 ("R$ 45.512,00")
+WINE_ALCOHOL_FORMAT = {'thousands': '.', 'decimal': ',', 'currency_symbols': ['R$']}
+
+
+class NormalEquationAccumulator:
+    """
+    선형회귀 충분통계량의 누적 (마지막 컬럼이 target). 행 수, 컬럼 평균, 편차곱 합 C = Σ(v - mean)(v - mean)ᵀ 만 저장.
+    절편 컬럼을 포함한 정규방정식은 XᵀX = n·[[1, mᵀ], [m, mmᵀ + C/n]] 이므로 같은 정보 (normal_equations() 참고).
+
+    acc = NormalEquationAccumulator(['x1', 'x2', 'y'])
+    for values in chunks:            # rows x 3 float64 (NaN 없음)
+        acc.update(values)
+    coef, intercept = acc.solve()
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.rows = 0
+        self.mean = np.zeros(len(self.columns))
+        self.comoment = np.zeros((len(self.columns), len(self.columns)))
+
+    def update(self, values: np.ndarray) -> "NormalEquationAccumulator":
+        """rows x len(columns) float64 배열을 누적"""
+        if len(values) == 0:
+            return self
+        mean = values.mean(axis=0)
+        centered = values - mean
+        return self._combine(len(values), mean, centered.T @ centered)
+
+    def merge(self, other: "NormalEquationAccumulator") -> "NormalEquationAccumulator":
+        if other.columns != self.columns:
+            raise ValueError(f"Cannot merge accumulators with different columns: {other.columns} != {self.columns}")
+        if other.rows == 0:
+            return self
+        return self._combine(other.rows, other.mean, other.comoment)
+
+    def _combine(self, rows, mean, comoment):
+        # 평균/편차곱 합의 병합 (Chan et al.): 두 부분의 평균 차이만큼 co-moment 를 보정
+        total = self.rows + rows
+        delta = mean - self.mean
+        self.comoment = self.comoment + comoment + np.outer(delta, delta) * (self.rows * rows / total)
+        self.mean = self.mean + delta * (rows / total)
+        self.rows = total
+        return self
+
+    def normal_equations(self):
+        """
+        절편 컬럼(1)을 앞에 붙인 설계행렬의 (XᵀX, Xᵀy). 확인용 (solve() 는 더 안정적인 co-moment 로 계산).
+        """
+        p = len(self.columns) - 1
+        mean = np.concatenate([[1.0], self.mean])
+        gram = self.rows * np.outer(mean, mean)
+        gram[1:, 1:] += self.comoment
+        return gram[:p + 1, :p + 1], gram[:p + 1, p + 1]
+
+    def solve(self):
+        """
+        최소제곱 계수와 절편. 컬럼 척도를 맞춘 뒤 lstsq 로 풀어서 공선성/상수 컬럼도 sklearn 과 같은 최소 norm 해.
+
+        Returns:
+            tuple[np.ndarray, float]: (coef, intercept)
+        """
+        if self.rows == 0:
+            raise ValueError("No rows accumulated; cannot solve the regression.")
+        p = len(self.columns) - 1
+        cxx, cxy = self.comoment[:p, :p], self.comoment[:p, p]
+        scale = np.sqrt(np.diag(cxx))
+        scale[scale == 0] = 1.0
+        coef = np.linalg.lstsq(cxx / np.outer(scale, scale), cxy / scale, rcond=None)[0] / scale
+        intercept = self.mean[p] - self.mean[:p] @ coef
+        return coef, float(intercept)
+
+    def score(self, coef, intercept) -> dict:
+        """
+        누적된 행에 대한 예측 오차. sklearn 의 mean_squared_error / r2_score 와 같은 정의.
+
+        Returns:
+            dict: {'rows', 'mse', 'r2'}
+        """
+        if self.rows == 0:
+            return {'rows': 0, 'mse': np.nan, 'r2': np.nan}
+        p = len(self.columns) - 1
+        cxx, cxy, cyy = self.comoment[:p, :p], self.comoment[:p, p], self.comoment[p, p]
+        # Σ(y - ŷ)² = 잔차의 편차 제곱합 + rows x 잔차 평균²
+        offset = self.mean[p] - intercept - self.mean[:p] @ coef
+        sse = max(cyy - 2 * coef @ cxy + coef @ cxx @ coef, 0.0) + self.rows * offset ** 2
+        if cyy > 0:
+            r2 = 1 - sse / cyy
+        else:
+            r2 = 1.0 if sse == 0 else 0.0  # 상수 target: r2_score 와 같은 처리
+        return {'rows': self.rows, 'mse': float(sse / self.rows), 'r2': float(r2)}
+
+
+def split_mask(row_start, rows, test_size, seed=42):
+    """
+    행 번호 row_start ... row_start + rows - 1 중 test 로 보낼 행 (bool 배열, 약 test_size 비율).
+    행 번호의 hash 로 정하므로 chunk 크기나 처리 순서와 무관하게 같은 행이 test 가 된다.
+    """
+    if test_size <= 0:
+        return np.zeros(rows, dtype=bool)
+    index = np.arange(row_start, row_start + rows, dtype=np.uint64)
+    hashed = pd.util.hash_array(index, hash_key=str(seed).zfill(16)[-16:])
+    # 상위 53 bit -> [0, 1) 균등분포
+    return (hashed >> np.uint64(11)) * 2.0 ** -53 < test_size
+
+
+def clean_xy(chunk, columns, number_formats=None, engine='pandas'):
+    """
+    chunk 의 columns(feature..., target) 를 숫자로 정제한 float64 배열과, 모든 값이 유한한 행의 mask.
+
+    Parameters:
+        chunk (pd.DataFrame): 원본 chunk (문자열 컬럼 가능)
+        columns (list): feature 컬럼들 + 마지막에 target 컬럼
+        number_formats (dict | None): {컬럼: normalize_number_column 인자} 구분자/통화 기호가 있는 컬럼용
+        engine (str): vectorized_clean_value_numeric 의 engine ('pandas' 또는 'pyarrow')
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (rows x len(columns) float64, 사용할 행의 bool mask)
+    """
+    number_formats = number_formats or {}
+    values = np.empty((len(chunk), len(columns)), dtype='float64')
+    for i, col in enumerate(columns):
+        series = chunk[col]
+        if col in number_formats:
+            series = normalize_number_column(series, **number_formats[col])
+        cleaned = vectorized_clean_value_numeric(series, engine=engine)
+        values[:, i] = cleaned.to_numpy(dtype='float64', na_value=np.nan)
+    # 정제 후 결측/무한대가 있는 행은 제외 (sklearn 은 NaN 이 있으면 학습하지 않음)
+    return values, np.isfinite(values).all(axis=1)
+
+
+def _chunk_stats(job):
+    # worker 에서 실행: chunk 정제 + train/test 누적 (반환값은 (컬럼 수)² 크기라 process 간 전달 비용이 작음)
+    chunk, row_start, columns, test_size, seed, number_formats, engine = job
+    values, usable = clean_xy(chunk, columns, number_formats, engine)
+    test = split_mask(row_start, len(chunk), test_size, seed)
+    train_acc = NormalEquationAccumulator(columns).update(values[usable & ~test])
+    test_acc = NormalEquationAccumulator(columns).update(values[usable & test])
+    return train_acc, test_acc, int((~usable).sum())
+
+
+def fit_chunks(chunks, target, features, test_size=0.0, seed=42, number_formats=None, engine='pandas',
+               workers=1, backend='thread'):
+    """
+    DataFrame chunk iterable 로 선형회귀 학습 (chunk 는 한 번만 읽고, workers 개 이상 동시에 메모리에 두지 않음).
+
+    Parameters:
+        chunks (Iterable[pd.DataFrame]): 같은 컬럼의 chunk 들 (예: pd.read_csv(chunksize=..., dtype=str))
+        target (str): 목표 컬럼
+        features (list): 입력 컬럼
+        test_size (float): test 로 보낼 행 비율 (0 이면 전부 학습)
+        seed (int): split_mask seed
+        number_formats (dict | None): clean_xy 참고
+        engine (str): 숫자 정제 engine ('pandas' 또는 'pyarrow')
+        workers (int): 1 보다 크면 chunk 를 workers 개씩 pool 에서 정제/누적한 뒤 merge
+        backend (str): 'thread' 또는 'process'. object 문자열 정제는 GIL 을 잡으므로 'process' 가 더 잘 확장됨
+
+    Returns:
+        dict: {'coef' (pd.Series), 'intercept', 'rows', 'dropped', 'train': score, 'test': score 또는 None}
+    """
+    if backend not in ('thread', 'process'):
+        raise ValueError(f"Unsupported backend: '{backend}'. Use 'thread' or 'process'.")
+    if not 0 <= test_size < 1:
+        raise ValueError("test_size must be in [0, 1)")
+    columns = list(features) + [target]
+    train = NormalEquationAccumulator(columns)
+    test = NormalEquationAccumulator(columns)
+    dropped = 0
+
+    def jobs():
+        row_start = 0
+        for chunk in chunks:
+            yield chunk, row_start, columns, test_size, seed, number_formats, engine
+            row_start += len(chunk)
+
+    def add(part):
+        nonlocal dropped
+        train.merge(part[0])
+        test.merge(part[1])
+        dropped += part[2]
+
+    if workers <= 1:
+        for job in jobs():
+            add(_chunk_stats(job))
+    else:
+        executor_cls = ThreadPoolExecutor if backend == 'thread' else ProcessPoolExecutor
+        pending = jobs()
+        with executor_cls(max_workers=workers) as executor:
+            while True:
+                # workers 개씩만 읽어서 메모리에 동시에 올라가는 chunk 수를 제한
+                batch = list(itertools.islice(pending, workers))
+                if not batch:
+                    break
+                for part in executor.map(_chunk_stats, batch):
+                    add(part)
+
+    coef, intercept = train.solve()
+    return {
+        'coef': pd.Series(coef, index=list(features), name=target),
+        'intercept': intercept,
+        'rows': train.rows,
+        'dropped': dropped,
+        'train': train.score(coef, intercept),
+        'test': test.score(coef, intercept) if test_size > 0 else None,
+    }
+
+
+def fit_csv(path, target, features=None, chunksize=100_000, test_size=0.0, seed=42, number_formats=None,
+            engine='pandas', workers=1, backend='thread', **read_csv_kwargs):
+    """
+    CSV/TSV 파일을 chunk 단위로 읽으면서 선형회귀 학습 (파일 전체를 메모리에 올리지 않음).
+
+    Parameters:
+        path (str): 입력 파일. '.tsv'/'.tab'/'.txt' 는 TAB 구분
+        target (str): 목표 컬럼
+        features (list | None): 입력 컬럼. None 이면 target 을 뺀 모든 컬럼
+        chunksize (int): chunk 행 수
+        test_size, seed, number_formats, engine, workers, backend: fit_chunks 참고
+        **read_csv_kwargs: pd.read_csv 인자 (예: encoding)
+
+    Returns:
+        dict: fit_chunks 결과
+    """
+    ext = os.path.splitext(path)[1].lower()
+    read_csv_kwargs.setdefault('sep', '\t' if ext in ('.tsv', '.tab', '.txt') else ',')
+    if features is None:
+        header = pd.read_csv(path, nrows=0, **read_csv_kwargs).columns
+        features = [col for col in header if col != target]
+    read_csv_kwargs.setdefault('dtype', str)
+    with stage('fit_csv', file=path) as st:
+        st.add(bytes_read=file_size(path))
+        with pd.read_csv(path, chunksize=chunksize, usecols=list(features) + [target], **read_csv_kwargs) as reader:
+            model = fit_chunks(reader, target, features, test_size, seed, number_formats, engine, workers, backend)
+        st.add(rows=model['rows'] + model['dropped'] + (model['test']['rows'] if model['test'] else 0))
+    return model
+
+
+def predict(model, df, number_formats=None, engine='pandas'):
+    """
+    fit_chunks/fit_csv 결과로 예측. 정제 후 결측이 있는 행은 NaN.
+
+    Returns:
+        pd.Series: 예측값 (df 와 같은 index)
+    """
+    features = list(model['coef'].index)
+    values, usable = clean_xy(df, features, number_formats, engine)
+    pred = values @ model['coef'].to_numpy() + model['intercept']
+    pred[~usable] = np.nan
+    return pd.Series(pred, index=df.index, name=model['coef'].name)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    # python linear_regression.py [csv] [chunksize]  (default: winequality-white.csv, 1,000)
+    path = sys.argv[1] if len(sys.argv) > 1 else 'winequality-white.csv'
+    chunksize = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    formats = {'alcohol': WINE_ALCOHOL_FORMAT}
+
+    start = time.perf_counter()
+    model = fit_csv(path, target='quality', chunksize=chunksize, test_size=0.2, number_formats=formats)
+    print(f"[INFO] fit_csv {model['rows']:,} train rows ({model['dropped']:,} dropped) "
+          f"{time.perf_counter() - start:.2f}s")
+    print(model['coef'].to_string())
+    print(f"intercept {model['intercept']:.6f}")
+    print(f"train {model['train']}")
+    print(f"test  {model['test']}")
+
+    # 같은 행으로 메모리 안에서 학습한 결과와 비교 (sklearn 이 없으면 NumPy lstsq)
+    # alcohol 은 정제 후에도 1e13 규모라 원래 척도 그대로 lstsq 에 넣으면 나머지 컬럼의 특이값이 잘려 나가므로
+    # 표준편차로 나눠 학습하고 계수를 되돌린다 (alcohol 을 뺀 notebook 의 X 는 척도를 맞추지 않아도 같은 결과)
+    df = pd.read_csv(path, dtype=str)
+    values, usable = clean_xy(df, list(model['coef'].index) + ['quality'], formats)
+    test = split_mask(0, len(df), 0.2)
+    X_train, Y_train = values[usable & ~test, :-1], values[usable & ~test, -1]
+    X_test, Y_test = values[usable & test, :-1], values[usable & test, -1]
+    scale = X_train.std(axis=0)
+    scale[scale == 0] = 1.0
+    try:
+        from sklearn.linear_model import LinearRegression
+        from sklearn.metrics import mean_squared_error, r2_score
+
+        reference = LinearRegression().fit(X_train / scale, Y_train)
+        ref_coef, ref_intercept = reference.coef_ / scale, reference.intercept_
+        Y_pred = reference.predict(X_test / scale)
+        ref_mse, ref_r2 = mean_squared_error(Y_test, Y_pred), r2_score(Y_test, Y_pred)
+    except ImportError:
+        design = np.column_stack([np.ones(len(X_train)), X_train / scale])
+        solution = np.linalg.lstsq(design, Y_train, rcond=None)[0]
+        ref_intercept, ref_coef = solution[0], solution[1:] / scale
+        Y_pred = X_test @ ref_coef + ref_intercept
+        ref_mse = np.mean((Y_test - Y_pred) ** 2)
+        ref_r2 = 1 - np.sum((Y_test - Y_pred) ** 2) / np.sum((Y_test - Y_test.mean()) ** 2)
+    print(f"max |coef - reference| {np.max(np.abs(model['coef'].to_numpy() - ref_coef)):.3e}, "
+          f"intercept {abs(model['intercept'] - ref_intercept):.3e}, "
+          f"test mse {abs(model['test']['mse'] - ref_mse):.3e}, r2 {abs(model['test']['r2'] - ref_r2):.3e}")
@@ -0,0 +1,157 @@
+import pandas as pd
+import numpy as np
+
+"""
+Precompiled "null-token" matcher shared by the column cleaners.
+filter_bad_value 목록을 한 번만 casefold 된 frozenset 으로 만들어 두고,
+셀마다 리스트를 다시 만들거나 .str.strip().str.lower() 임시 컬럼을 만들지 않고 bad value 를 찾는다.
+
+matcher = NullTokenMatcher(filter_bad_value)
+' NULL ' in matcher                 # True
+series.mask(matcher.mask(series))   # bad values -> NaN
+matcher.mask_series(series)         # same, Arrow-backed str columns stay in Arrow
+"""
+
+
+class NullTokenMatcher:
+    """
+    Case-insensitive, whitespace-insensitive matcher for known bad values.
+    Rebuild it if the token list (e.g. filter_bad_value) is changed at runtime.
+
+    Parameters:
+        tokens (Iterable[str]): Bad-value tokens such as ["", "none", "null", "nan", "-", "*"].
+    """
+
+    def __init__(self, tokens):
+        self.tokens = frozenset(str(t).strip().casefold() for t in tokens)
+        self._arrow_tokens = None
+        # casefold 은 글자 수를 줄이지 않으므로 이보다 긴 값은 token 이 될 수 없음
+        self._max_len = max((len(t) for t in self.tokens), default=0)
+
+    def __contains__(self, val):
+        return isinstance(val, str) and val.strip().casefold() in self.tokens
+
+    def __repr__(self):
+        return f"NullTokenMatcher({sorted(self.tokens)})"
+
+    def mask(self, series, stripped=False):
+        """
+        Boolean mask of bad values in a Series, as a NumPy array.
+
+        Parameters:
+            series (pd.Series): Column to check. Non-string cells never match.
+            stripped (bool): Values are already whitespace-stripped (skips the per-cell strip).
+
+        Returns:
+            np.ndarray: bool array, True where the cell is a bad value.
+        """
+        if _is_arrow_string(series.dtype):
+            return self._mask_arrow(series, stripped)
+
+        tokens = self.tokens
+        values = series.to_numpy(dtype=object)
+        if stripped:
+            cells = (isinstance(v, str) and v.casefold() in tokens for v in values)
+        else:
+            cells = (isinstance(v, str) and v.strip().casefold() in tokens for v in values)
+        # one bool per cell, no temporary string columns
+        return np.fromiter(cells, dtype=bool, count=len(values))
+
+    def mask_series(self, series, stripped=False):
+        """
+        series.mask(self.mask(series)) : bad values -> missing, same dtype.
+        Arrow-backed string columns stay in Arrow (pc.if_else), without a NumPy mask or Python objects.
+        """
+        if not _is_arrow_string(series.dtype):
+            return series.mask(self.mask(series, stripped))
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        arr = pa.array(series.array)
+        cleaned = pc.if_else(self.arrow_mask(arr, stripped), pa.scalar(None, arr.type), arr)
+        return pd.Series(series.dtype.__from_arrow__(cleaned), index=series.index, name=series.name)
+
+    def _mask_arrow(self, series, stripped):
+        return self.arrow_mask(series.array, stripped).to_numpy(zero_copy_only=False)
+
+    def arrow_mask(self, arr, stripped=False):
+        """
+        Bad-value mask computed with pyarrow.compute kernels (no Python object per cell).
+        Same result as mask() on object values: strip() uses Python's whitespace set, ASCII values are
+        lower-cased by Arrow (same as casefold), and only short non-ASCII values are casefolded in Python.
+
+        Parameters:
+            arr (pa.Array | ArrowExtensionArray): Arrow string values.
+            stripped (bool): Values are already whitespace-stripped.
+
+        Returns:
+            pa.BooleanArray: True where the cell is a bad value (nulls are False).
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if self._arrow_tokens is None:
+            self._arrow_tokens = pa.array(sorted(self.tokens), type=pa.string())
+        arr = pa.array(arr)
+        if not stripped:
+            arr = pc.utf8_trim(arr, characters=_PY_WHITESPACE)
+        hit = pc.fill_null(pc.is_in(pc.ascii_lower(arr), value_set=self._arrow_tokens), False)
+
+        # non-ASCII: casefold 과 Arrow 의 소문자 변환이 다를 수 있음 (ß -> ss, ſ -> s 등).
+        # token 길이 이하인 값만 고유값 단위로 Python casefold 로 다시 확인
+        recheck = pc.and_(pc.less_equal(pc.utf8_length(arr), self._max_len), pc.invert(pc.string_is_ascii(arr)))
+        pos = np.flatnonzero(pc.fill_null(recheck, False).to_numpy(zero_copy_only=False))
+        if len(pos) == 0:
+            return hit
+        encoded = pc.dictionary_encode(pa.chunked_array([arr.take(pa.array(pos))]).combine_chunks())
+        found = np.array([v.casefold() in self.tokens for v in encoded.dictionary.to_pylist()], dtype=bool)
+        mask = hit.to_numpy(zero_copy_only=False).copy()
+        mask[pos] = found[encoded.indices.to_numpy(zero_copy_only=False)]
+        return pa.array(mask)
+
+
+# Python str.strip() 이 지우는 공백 (str.isspace() 인 글자. Arrow 의 utf8_trim_whitespace 와는 \x1c-\x1f 가 다름)
+_PY_WHITESPACE = ('\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006'
+                  '\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000')
+
+
+def _is_arrow_string(dtype):
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage in ('pyarrow', 'pyarrow_numpy')
+    return isinstance(dtype, pd.ArrowDtype) and pd.api.types.is_string_dtype(dtype)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import tracemalloc
+
+    # python null_tokens.py [rows]  (default 1,000,000)
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    filter_bad_value = ["", "none", "null", "nan", "-", "*"]
+    matcher = NullTokenMatcher(filter_bad_value)
+
+    rng = np.random.default_rng(0)
+    pool = np.array(['abc', ' NULL', 'x y z', '-', '12345', 'None ', '*'] + [f"v{i}" for i in range(1000)], dtype=object)
+    series = pd.Series(rng.choice(pool, n_rows), dtype=object)
+
+    def list_isin(s):
+        return s.str.strip().str.lower().isin([v.lower() for v in filter_bad_value]).to_numpy()
+
+    for label, s in [('object', series), ('string[pyarrow]', series.astype('string[pyarrow]'))]:
+        for name, func in [('str.strip().str.lower().isin', list_isin), ('NullTokenMatcher.mask', matcher.mask)]:
+            tracemalloc.start()
+            start = time.perf_counter()
+            result = func(s)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{label:16s} {name:30s} {elapsed:8.3f}s  peak {peak / 1e6:9.1f} MB  bad={int(result.sum())}")
+
+    # object / Arrow 경로가 같은 값을 같게 판정하는지 (casefold 만의 변환 ß -> ss, ſ -> s, Python 만의 공백 \x1c)
+    tricky = NullTokenMatcher(filter_bad_value + ['ss', 'strasse', '없음'])
+    cases = pd.Series(['ß', 'ẞ', 'STRAẞE', 'ſ', 'nuLL', '\x1cnull\x1c', '　none', ' 없음 ', 'ß-', 'ÑULL', None], dtype=object)
+    expected = np.array([v in tricky for v in cases])
+    for label, s in [('object', cases), ('str', cases.astype('str')), ('string[pyarrow]', cases.astype('string[pyarrow]'))]:
+        same = np.array_equal(tricky.mask(s), expected) and tricky.mask_series(s).isna().equals(pd.Series(expected | cases.isna().to_numpy()))
+        print(f"{label:16s} parity with 'val in matcher': {'OK' if same else 'MISMATCH'}")
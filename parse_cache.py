@@ -0,0 +1,104 @@
+import pandas as pd
+import numpy as np
+import threading
+from collections import OrderedDict
+
+"""
+Unique-value memoization for the column cleaners.
+컬럼의 고유값만 한 번씩 파싱하고, 결과는 factorize codes 로 원래 행에 다시 펼친다.
+ParseCache 를 넘기면 여러 컬럼/DataFrame 사이에서 파싱 결과를 재사용한다(LRU).
+
+cache = ParseCache(maxsize=100_000)
+df['col_ym'] = vectorized_clean_value_date(df['col_ym'], cache=cache)
+print(cache.info())
+"""
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of parsed values, shared across columns and DataFrames.
+    Safe to share between threads; not shared between processes.
+
+    Parameters:
+        maxsize (int): Maximum number of cached values (least recently used evicted first).
+    """
+
+    def __init__(self, maxsize=100_000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data), 'maxsize': self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def parse(self, values, parse, kind):
+        """
+        Parse distinct values, reusing cached results and parsing only the misses in one batch.
+
+        Parameters:
+            values (pd.Series): Distinct raw values (object dtype).
+            parse (callable): Batch parser, pd.Series -> pd.Series.
+            kind (str): Cache namespace, one per parser (e.g. 'vectorized.date').
+
+        Returns:
+            pd.Series: Parsed values aligned with `values`.
+        """
+        out = np.empty(len(values), dtype=object)
+        miss = []
+        with self._lock:
+            for i, val in enumerate(values):
+                # type in the key: 20250301, 20250301.0 and True hash equal but parse differently
+                key = (kind, type(val), val)
+                if key in self._data:
+                    self._data.move_to_end(key)
+                    out[i] = self._data[key]
+                else:
+                    miss.append(i)
+            self.hits += len(values) - len(miss)
+            self.misses += len(miss)
+
+        if miss:
+            # parse outside the lock so other threads can keep hitting the cache
+            parsed = parse(values.iloc[miss].reset_index(drop=True))
+            with self._lock:
+                for i, result in zip(miss, parsed.tolist()):
+                    out[i] = result
+                    val = values.iloc[i]
+                    self._data[(kind, type(val), val)] = result
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+        return pd.Series(out, dtype=object).infer_objects()
+
+
+def parse_unique(series, parse, kind, cache=None):
+    """
+    Factorize-then-parse: parse each distinct value once and broadcast back via the codes.
+
+    Parameters:
+        series (pd.Series): Column to clean.
+        parse (callable): Batch parser, pd.Series -> pd.Series.
+        kind (str): Cache namespace, one per parser (e.g. 'vectorized.date').
+        cache (ParseCache | None): Optional shared cache.
+
+    Returns:
+        pd.Series: Parsed column with the original index and name.
+    """
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+    parsed = parse(uniques) if cache is None else cache.parse(uniques, parse, kind)
+    # code -1 (missing) has no label, so reindex fills it with NaN/NaT of the parsed dtype
+    result = parsed.reset_index(drop=True).reindex(codes)
+    result.index = series.index
+    result.name = series.name
+    return result
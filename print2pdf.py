@@ -1,32 +1,424 @@
 import os
+import pickle
+import shutil
+import itertools
+import tempfile
+import subprocess
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
-from tabulate import tabulate
 from reportlab.lib.pagesizes import A4, LETTER, landscape, portrait
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-import win32print
-import win32api
+from instrument import stage, instrumented, file_size
 
+# 폰트 파일 검색 경로(하위 폴더 포함): PRINT2PDF_FONT_PATH 환경변수(os.pathsep 구분) -> OS 기본 폰트 폴더
+FONT_DIRS = [p for p in os.environ.get('PRINT2PDF_FONT_PATH', '').split(os.pathsep) if p] + [
+    os.path.expandvars("%LOCALAPPDATA%/Microsoft/Windows/Fonts"),
+    "C:/Windows/Fonts",
+    os.path.expanduser("~/.local/share/fonts"),
+    os.path.expanduser("~/.fonts"),
+    "/usr/local/share/fonts",
+    "/usr/share/fonts",
+]
 
-def truncate_cell_values(df: pd.DataFrame, max_width: int) -> pd.DataFrame:
+# 폰트 이름별 파일 이름 후보 (없는 이름은 <font_name>.ttf / .ttc)
+FONT_FILES = {
+    'D2Coding': ['D2Coding-Ver1.3.2-20180524-all.ttc', 'D2Coding.ttc', 'D2Coding.ttf'],
+}
+
+_registered_fonts = {}
+_char_widths = None
+
+
+def _east_asian_widths() -> np.ndarray:
+    """코드 포인트별 표시 폭 lookup table (East Asian Wide/Fullwidth = 2, NUL = 0, 그 외 1). 처음 쓸 때 한 번 생성."""
+    global _char_widths
+    if _char_widths is None:
+        widths = np.fromiter((2 if unicodedata.east_asian_width(chr(cp)) in 'WF' else 1 for cp in range(0x110000)),
+                             dtype=np.uint8, count=0x110000)
+        widths[0] = 0
+        _char_widths = widths
+    return _char_widths
+
+
+def _codepoints(text: pd.Series) -> np.ndarray:
+    """문자열 Series -> (행 수, 최대 글자 수) uint32 코드 포인트 배열 (짧은 문자열의 뒤쪽은 0)"""
+    values = np.asarray(text.to_numpy(dtype=object), dtype=str)
+    return values.view(np.uint32).reshape(len(values), -1)
+
+
+def text_width(text: str) -> int:
+    """문자열 하나의 표시 폭 (고정폭 글꼴 기준, 한글 등 East Asian Wide = 2칸)"""
+    widths = _east_asian_widths()
+    return int(sum(widths[ord(ch)] for ch in text))
+
+
+def display_width(text: pd.Series) -> np.ndarray:
+    """문자열 Series 의 셀별 표시 폭 (text_width 의 vectorized 버전)"""
+    if len(text) == 0:
+        return np.zeros(0, dtype=np.int64)
+    return _east_asian_widths()[_codepoints(text)].sum(axis=1, dtype=np.int64)
+
+
+def truncate_text(text: pd.Series, max_width: int, east_asian_width: bool = False,
+                  chunk_rows: int = 100_000) -> pd.Series:
+    """
+    문자열 Series 를 max_width 로 자르고 말줄임표(…) 처리 (vectorized, 잘리는 셀만 다시 만듦).
+
+    Parameters:
+        text (pd.Series): 문자열 Series
+        max_width (int): 최대 글자 수 (east_asian_width=True 이면 최대 표시 폭)
+        east_asian_width (bool): 글자 수 대신 표시 폭 기준 (한글 등 East Asian Wide = 2칸, 말줄임표 = 1칸)
+        chunk_rows (int): 표시 폭 계산 시 한 번에 처리할 행 수 (임시 배열 크기 제한)
+
+    Returns:
+        pd.Series: 잘린 문자열 Series (index, name, dtype 유지)
+    """
+    if not east_asian_width:
+        if text.dtype != object:
+            # Arrow 기반 str dtype: 컬럼 전체 str.len / slice + mask 가 가장 빠름
+            over = (text.str.len() > max_width).to_numpy(dtype=bool)
+            return text.mask(over, text.str.slice(0, max_width - 1) + '…') if over.any() else text
+        # object dtype: 길이는 map(len) 으로 한 번에 구하고(셀마다 Python 함수 호출 없음) 잘리는 셀만 다시 만듦
+        values = text.to_numpy(dtype=object)
+        rows = np.flatnonzero(np.fromiter(map(len, values), dtype=np.int64, count=len(values)) > max_width)
+        if not len(rows):
+            return text
+        result = values.copy()
+        result[rows] = [v[:max_width - 1] + '…' for v in values[rows]]
+        return pd.Series(result, index=text.index, name=text.name, dtype=object)
+
+    # 표시 폭 >= 글자 수 이므로 앞의 max_width + 1 글자만 보면 잘림 여부와 자를 위치를 알 수 있음
+    widths = _east_asian_widths()
+    result = None
+    for start in range(0, len(text), chunk_rows):
+        head = text.iloc[start:start + chunk_rows].str.slice(0, max_width + 1)
+        codes = _codepoints(head)
+        cum = widths[codes].cumsum(axis=1, dtype=np.int32)
+        over = np.flatnonzero(cum[:, -1] > max_width)
+        if not len(over):
+            continue
+        # 말줄임표 자리(1칸)를 남기고 들어가는 글자 수까지 남기고 나머지는 0 으로 (numpy 문자열은 뒤쪽 0 을 버림)
+        keep = (cum[over] <= max_width - 1).sum(axis=1)
+        trimmed = codes[over].copy()
+        trimmed[np.arange(codes.shape[1]) >= keep[:, None]] = 0
+        cut = trimmed.view(f'<U{codes.shape[1]}').ravel().astype(object) + '…'
+        if result is None:
+            result = text.to_numpy(dtype=object, copy=True)
+        result[start + over] = cut
+    if result is None:
+        return text
+    return pd.Series(result, index=text.index, name=text.name, dtype=text.dtype)
+
+
+def truncate_cell_values(df: pd.DataFrame, max_width: int, east_asian_width: bool = False) -> pd.DataFrame:
     """
     각 셀 문자열을 max_width로 제한하고 말줄임표 처리.
 
     Parameters:
         df (pd.DataFrame): 원본 데이터프레임
-        max_width (int): 출력 최대 글자 수
+        max_width (int): 출력 최대 글자 수 (east_asian_width=True 이면 최대 표시 폭)
+        east_asian_width (bool): 한글 등 East Asian Wide 문자를 2칸으로 계산
 
     Returns:
         pd.DataFrame: 각 셀이 잘린 문자열을 포함한 DataFrame
     """
-    def truncate(x):
-        x_str = str(x)
-        return x_str if len(x_str) <= max_width else x_str[:max_width - 1] + '…'
+    # pandas 3 의 str dtype 은 결측값을 그대로 두므로 기존 str(x) 결과와 같게 'nan' 으로 채움
+    return df.astype(str).fillna('nan').apply(lambda col: truncate_text(col, max_width, east_asian_width))
+
+
+def _text_column(series: pd.Series, max_width: int, east_asian_width: bool = False) -> pd.Series:
+    """출력용 셀 문자열: 말줄임 처리 후 앞뒤 공백 제거(tabulate 와 동일), 줄바꿈은 공백으로."""
+    text = truncate_text(series.astype(str).fillna('nan'), max_width, east_asian_width)
+    return text.str.strip().str.replace('\n', ' ', regex=False)
+
+
+def _text_widths(text: pd.Series, east_asian_width: bool) -> np.ndarray:
+    return display_width(text) if east_asian_width else text.str.len().to_numpy(dtype=np.int64)
+
+
+def _ljust(text: pd.Series, width: int, east_asian_width: bool) -> pd.Series:
+    """표시 폭 기준 왼쪽 정렬 (east_asian_width=False 이면 str.ljust 와 같음)"""
+    if not east_asian_width:
+        return text.str.ljust(width)
+    pad = np.maximum(width - display_width(text), 0)
+    spaces = np.array([' ' * k for k in range(int(pad.max(initial=0)) + 1)], dtype=object)
+    return text + pd.Series(spaces[pad], index=text.index, dtype=object)
+
+
+def _header_width(header: str, east_asian_width: bool) -> int:
+    return text_width(header) if east_asian_width else len(header)
+
+
+def _table_columns(df: pd.DataFrame, max_width: int, show_index: bool, east_asian_width: bool) -> list[pd.Series]:
+    columns = [_text_column(df.iloc[:, i], max_width, east_asian_width) for i in range(df.shape[1])]
+    if show_index:
+        columns.insert(0, pd.Series(df.index.astype(str), index=df.index).str.strip())
+    return columns
+
+
+def psql_column_widths(df: pd.DataFrame, max_width: int, show_index: bool = False,
+                       east_asian_width: bool = False) -> list[int]:
+    """
+    tabulate psql 형식의 컬럼 폭 계산(컬럼별 vectorized 1회, 한 번에 한 컬럼만 문자열로 변환).
+    폭 = max(헤더 길이 + 2, 말줄임 처리된 셀 최대 길이). east_asian_width=True 이면 길이 대신 표시 폭.
+    """
+    headers = ([''] if show_index else []) + [str(col) for col in df.columns]
+    widths = [_header_width(h, east_asian_width) + 2 for h in headers]
+    if len(df):
+        if show_index:
+            index_text = pd.Series(df.index.astype(str)).str.strip()
+            widths[0] = max(widths[0], int(_text_widths(index_text, east_asian_width).max()))
+        offset = 1 if show_index else 0
+        for i in range(df.shape[1]):
+            text = _text_column(df.iloc[:, i], max_width, east_asian_width)
+            widths[offset + i] = max(widths[offset + i], int(_text_widths(text, east_asian_width).max()))
+    return widths
+
 
-    return df.astype(str).apply(lambda col: col.map(truncate))
+def iter_psql_lines(df: pd.DataFrame, widths: list[int], max_width: int, show_index: bool = False,
+                    chunk_rows: int = 1000, east_asian_width: bool = False):
+    """
+    tabulate(tablefmt='psql') 과 같은 모양의 데이터 줄을 chunk_rows 행씩 만들어 yield(마지막 테두리 포함).
+    전체 테이블 문자열을 만들지 않으므로 메모리는 chunk 크기에 비례.
+    """
+    for start in range(0, len(df), chunk_rows):
+        columns = _table_columns(df.iloc[start:start + chunk_rows], max_width, show_index, east_asian_width)
+        lines = '| ' + _ljust(columns[0], widths[0], east_asian_width)
+        for col, width in zip(columns[1:], widths[1:]):
+            lines = lines + ' | ' + _ljust(col, width, east_asian_width)
+        yield from (lines + ' |').tolist()
+    yield '+' + '+'.join('-' * (w + 2) for w in widths) + '+'
+
+
+def _spill_chunks(chunks, max_width: int, show_index: bool, east_asian_width: bool, tmp_dir: str | None = None):
+    """
+    chunk 들을 임시 파일에 pickle 로 내리면서 컬럼 폭을 누적(chunk 별 폭의 최댓값 = 전체 폭, 메모리는 chunk 크기).
+    (임시 파일, 빈 DataFrame(컬럼 정보), 전체 행 수, 컬럼 폭) 반환. chunk 가 없으면 컬럼 없는 빈 DataFrame.
+    """
+    f = tempfile.TemporaryFile(dir=tmp_dir)
+    head, rows, widths = None, 0, []
+    for chunk in chunks:
+        chunk_widths = psql_column_widths(chunk, max_width=max_width, show_index=show_index,
+                                          east_asian_width=east_asian_width)
+        if head is None:
+            head, widths = chunk.iloc[:0], chunk_widths
+        else:
+            widths = [max(a, b) for a, b in zip(widths, chunk_widths)]
+        pickle.dump(chunk, f, protocol=pickle.HIGHEST_PROTOCOL)
+        rows += len(chunk)
+    f.seek(0)
+    return f, (head if head is not None else pd.DataFrame()), rows, widths
+
+
+def _iter_spilled_lines(f, widths: list[int], max_width: int, show_index: bool, chunk_rows: int,
+                        east_asian_width: bool):
+    """_spill_chunks 의 chunk 를 하나씩 읽어 데이터 줄을 yield(아래 테두리는 마지막에 한 번). 끝나면 임시 파일 닫음."""
+    try:
+        while True:
+            try:
+                chunk = pickle.load(f)
+            except EOFError:
+                break
+            yield from itertools.islice(iter_psql_lines(chunk, widths, max_width=max_width, show_index=show_index,
+                                                        chunk_rows=chunk_rows, east_asian_width=east_asian_width),
+                                        len(chunk))
+        yield '+' + '+'.join('-' * (w + 2) for w in widths) + '+'
+    finally:
+        f.close()
+
+
+def psql_header_lines(df: pd.DataFrame, widths: list[int], show_index: bool = False,
+                      east_asian_width: bool = False) -> list[str]:
+    headers = ([''] if show_index else []) + [str(col) for col in df.columns]
+    padded = [h + ' ' * max(w - _header_width(h, east_asian_width), 0) for h, w in zip(headers, widths)]
+    return [
+        '+' + '+'.join('-' * (w + 2) for w in widths) + '+',
+        '| ' + ' | '.join(padded) + ' |',
+        '|' + '+'.join('-' * (w + 2) for w in widths) + '|',
+    ]
+
+
+def lines_per_page(height: float, margin_y: float, line_height: float, header_count: int) -> int:
+    """
+    한 페이지에 그려지는 데이터 줄 수. 그리기 루프(_draw_pages)와 같은 y 계산을 그대로 반복(최소 1줄).
+    """
+    y = height - margin_y
+    for _ in range(header_count):
+        y -= line_height
+    count = 0
+    while y >= margin_y + line_height:
+        count += 1
+        y -= line_height
+    return max(1, count)
+
+
+def _draw_pages(c, header_lines, lines, font_name, font_size, height, margin_x, margin_y, line_height) -> None:
+    """lines 를 페이지마다 header_lines 를 반복하면서 canvas 에 그림(저장은 호출한 쪽에서)."""
+    c.setFont(font_name, font_size)
+    y = height - margin_y
+
+    def draw_header():
+        nonlocal y
+        for hline in header_lines:
+            c.drawString(margin_x, y, hline)
+            y -= line_height
+
+    draw_header()
+    for line in lines:
+        if y < margin_y + line_height:
+            c.showPage()
+            c.setFont(font_name, font_size)
+            y = height - margin_y
+            draw_header()
+        c.drawString(margin_x, y, line)
+        y -= line_height
 
 
+def _render_part(part_filename, df_part, last, col_widths, header_lines, max_col_width, show_index, east_asian_width,
+                 page_size, font_name, font_path, font_size, line_height, margin_x, margin_y, rows_per_page):
+    """process pool 작업 단위: 페이지 경계에서 잘린 df_part 를 부분 PDF 로 저장(마지막 part 만 아래 테두리 포함)"""
+    register_font(font_name, font_path)
+    lines = iter_psql_lines(df_part, col_widths, max_width=max_col_width, show_index=show_index,
+                            chunk_rows=rows_per_page, east_asian_width=east_asian_width)
+    if not last:
+        lines = itertools.islice(lines, len(df_part))
+    c = canvas.Canvas(part_filename, pagesize=page_size)
+    _draw_pages(c, header_lines, lines, font_name, font_size, page_size[1], margin_x, margin_y, line_height)
+    c.save()
+    return part_filename
+
+
+def merge_pdfs(part_filenames: list[str], pdf_filename: str) -> None:
+    """부분 PDF 들을 순서대로 이어 붙여 pdf_filename 으로 저장 (pypdf 필요)."""
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for part in part_filenames:
+        writer.append(part)
+    with open(pdf_filename, 'wb') as f:
+        writer.write(f)
+    writer.close()
+
+
+def find_font(font_name: str) -> str:
+    """
+    FONT_DIRS 에서 font_name 의 폰트 파일을 찾음.
+
+    Raises:
+        FileNotFoundError: 어느 검색 경로에도 폰트 파일이 없음
+    """
+    filenames = FONT_FILES.get(font_name, [f"{font_name}.ttf", f"{font_name}.ttc"])
+    for font_dir in FONT_DIRS:
+        for root, _, files in os.walk(font_dir):
+            for filename in filenames:
+                if filename in files:
+                    return os.path.join(root, filename)
+    raise FileNotFoundError(f"폰트 '{font_name}' 파일을 찾을 수 없습니다: {filenames} (검색 경로: {FONT_DIRS})")
+
+
+def register_font(font_name: str = "D2Coding", font_path: str | None = None) -> str:
+    """
+    폰트를 프로세스당 한 번만 등록(TTF 파싱은 첫 호출에만). 이미 등록된 이름은 처음 등록한 파일을 계속 사용.
+
+    Parameters:
+        font_name (str): reportlab 에 등록할 폰트 이름
+        font_path (str | None): 폰트 파일 경로. None 이면 find_font 로 검색
+
+    Returns:
+        str: 등록된 폰트 파일 경로
+
+    Raises:
+        FileNotFoundError: 폰트 파일 없음
+    """
+    if font_name in _registered_fonts:
+        return _registered_fonts[font_name]
+    if font_path is None:
+        font_path = find_font(font_name)
+    elif not os.path.exists(font_path):
+        raise FileNotFoundError(f"지정한 폰트 경로를 찾을 수 없습니다: {font_path}")
+    pdfmetrics.registerFont(TTFont(font_name, font_path))
+    _registered_fonts[font_name] = font_path
+    return font_path
+
+
+class PrintBackend:
+    """PDF 를 프린터로 보내는 방식. send() 를 구현한 클래스를 PRINT_BACKENDS 에 등록하면 printer 에서 사용 가능."""
+
+    def send(self, pdf_filename: str, target_printer: str) -> None:
+        raise NotImplementedError
+
+
+class FilePrintBackend(PrintBackend):
+    """PDF 파일만 저장하고 출력하지 않음(대량 작업, 프린터 없는 서버용)."""
+
+    def send(self, pdf_filename, target_printer):
+        print(f"[INFO] 파일 저장만 수행, 프린터 전송 생략: {pdf_filename}")
+
+
+class Win32PrintBackend(PrintBackend):
+    """Windows 스풀러: 기본 프린터를 잠시 target_printer 로 바꾸고 ShellExecute 로 출력 (pywin32 필요)."""
+
+    def __init__(self):
+        import win32print
+        import win32api
+        self.win32print = win32print
+        self.win32api = win32api
+
+    def send(self, pdf_filename, target_printer):
+        win32print, win32api = self.win32print, self.win32api
+        printers = [p[2] for p in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS)]
+        if target_printer not in printers:
+            raise ValueError(f"지정한 출력 프린터 '{target_printer}'가 시스템에 존재하지 않습니다.")
+
+        original_printer = win32print.GetDefaultPrinter()
+        print(f"[INFO] 원래 기본 프린터: {original_printer}")
+        print(f"[INFO] 임시 출력용 프린터: {target_printer}")
+
+        try:
+            win32print.SetDefaultPrinter(target_printer)
+            win32api.ShellExecute(0, "print", pdf_filename, None, ".", 0)
+            print("[INFO] 출력 명령 전송 완료.")
+        finally:
+            win32print.SetDefaultPrinter(original_printer)
+            print(f"[INFO] 기본 프린터 복원됨: {original_printer}")
+
+
+class CupsPrintBackend(PrintBackend):
+    """CUPS(Linux/macOS): lpstat 으로 프린터 확인 후 lp -d 로 전송."""
+
+    def send(self, pdf_filename, target_printer):
+        printers = subprocess.run(['lpstat', '-e'], capture_output=True, text=True, check=True).stdout.split()
+        if target_printer not in printers:
+            raise ValueError(f"지정한 출력 프린터 '{target_printer}'가 시스템에 존재하지 않습니다.")
+        subprocess.run(['lp', '-d', target_printer, pdf_filename], capture_output=True, text=True, check=True)
+        print(f"[INFO] 출력 명령 전송 완료: {target_printer}")
+
+
+PRINT_BACKENDS = {
+    'win32': Win32PrintBackend,
+    'cups': CupsPrintBackend,
+    'file': FilePrintBackend,
+}
+
+
+def get_print_backend(name: str | None = None) -> PrintBackend:
+    """
+    PRINT_BACKENDS 에서 출력 방식을 골라 생성(필요한 모듈은 이때 import).
+    name 이 None 이면 Windows 는 'win32', lp 명령이 있으면 'cups', 그 외는 'file'.
+    """
+    if name is None:
+        name = 'win32' if os.name == 'nt' else ('cups' if shutil.which('lp') else 'file')
+    key = name.strip().lower()
+    if key not in PRINT_BACKENDS:
+        raise ValueError(f"지원되지 않는 출력 방식: '{name}'. {list(PRINT_BACKENDS)} 중 하나를 사용하세요.")
+    return PRINT_BACKENDS[key]()
+
+
+@instrumented('printer')
 def printer(
     df: pd.DataFrame,
     font_size: int = 9,
@@ -36,13 +428,20 @@ def printer(
     orientation: str = 'portrait',
     max_col_width: int = 30,
     target_printer: str = "clawPDF",
-    line_height: int | None = None
+    line_height: int | None = None,
+    workers: int = 1,
+    font_name: str = "D2Coding",
+    font_path: str | None = None,
+    print_backend: str | None = None,
+    east_asian_width: bool = False
 ) -> None:
     """
-    Pandas DataFrame을 tabulate 텍스트 테이블로 PDF 출력 + 지정 프린터로 전송
+    Pandas DataFrame을 psql 형식 텍스트 테이블로 PDF 출력 + 지정 프린터로 전송
 
     Parameters:
-        df (pd.DataFrame): 출력할 데이터프레임
+        df (pd.DataFrame | Iterable[pd.DataFrame]): 출력할 데이터프레임. 같은 컬럼의 chunk iterable
+            (예: union_sort.iter_union_sort 결과)이면 chunk 를 임시 파일에 내려 폭을 구한 뒤 chunk 단위로 그림
+            (메모리는 chunk 크기에 비례, 결과 PDF 는 chunk 들을 합친 DataFrame 과 같음)
         font_size (int): PDF에 사용할 폰트 크기
         pdf_filename (str): 생성할 PDF 파일 경로
         show_index (bool): 인덱스 출력 여부
@@ -51,19 +450,22 @@ def printer(
         max_col_width (int): 각 셀 최대 출력 폭
         target_printer (str): 출력할 프린터 이름
         line_height (int | None): 한 줄당 줄 간격 (기본: font_size + 2)
+        workers (int): 2 이상이면 페이지 경계로 행을 나눠 process pool 에서 부분 PDF 를 만든 뒤 병합 (pypdf 필요).
+            페이지 구성과 헤더 반복은 workers=1 과 동일. chunk iterable 입력은 항상 한 프로세스에서 처리.
+        font_name (str): 고정폭 폰트 이름 (프로세스당 한 번만 등록)
+        font_path (str | None): 폰트 파일 경로. None 이면 FONT_DIRS 에서 검색
+        print_backend (str | None): 'win32', 'cups', 'file'(출력 안 함). None 이면 OS 에 맞게 자동 선택
+        east_asian_width (bool): 한글 등 East Asian Wide 문자를 2칸으로 계산해서 자르고 정렬 (D2Coding 등 고정폭 글꼴용)
 
     Raises:
-        FileNotFoundError: 지정된 폰트 경로 없음
+        FileNotFoundError: 폰트 파일 없음
         ValueError: 프린터 이름이 시스템에 존재하지 않을 경우
+        ImportError: 'win32' 출력 방식인데 pywin32 가 없음
     """
 
-    # [1] 폰트 설정
-    font_path = "C:/Users/BKHOME/AppData/Local/Microsoft/Windows/Fonts/D2Coding-Ver1.3.2-20180524-all.ttc"
-    font_name = "D2Coding"
-    if os.path.exists(font_path):
-        pdfmetrics.registerFont(TTFont(font_name, font_path))
-    else:
-        raise FileNotFoundError(f"지정한 폰트 경로를 찾을 수 없습니다: {font_path}")
+    # [1] 폰트 등록(프로세스당 1회) 및 출력 방식 선택
+    font_path = register_font(font_name, font_path)
+    backend = get_print_backend(print_backend)
 
     # [2] 페이지 설정
     size_dict = {'A4': A4, 'LETTER': LETTER}
@@ -80,52 +482,62 @@ def printer(
     # [3] 줄 높이 설정 (지정 없으면 기본값)
     line_height = line_height if line_height is not None else font_size + 2
 
-    # [4] 데이터 문자열 폭 제한 적용
-    df_limited = truncate_cell_values(df, max_width=max_col_width)
-    table_text = tabulate(df_limited, headers="keys", tablefmt="psql", showindex=show_index, numalign="left")
-    lines = table_text.splitlines()
-    header_lines = lines[:3]
-    data_lines = lines[3:]
-
-    # [5] PDF 생성
-    c = canvas.Canvas(pdf_filename, pagesize=page_size)
+    # [4] 데이터 문자열 폭 제한 적용 후 psql 형식 줄 생성
+    # 컬럼 폭을 먼저 계산하고, 데이터 줄은 페이지 크기만큼씩 만들어 바로 그림(전체 테이블 문자열을 만들지 않음)
     width, height = page_size
     margin_x, margin_y = 40, 40
-    c.setFont(font_name, font_size)
-    y = height - margin_y
-
-    def draw_header():
-        nonlocal y
-        for hline in header_lines:
-            c.drawString(margin_x, y, hline)
-            y -= line_height
-
-    draw_header()
-    for line in data_lines:
-        if y < margin_y + line_height:
-            c.showPage()
-            c.setFont(font_name, font_size)
-            y = height - margin_y
-            draw_header()
-        c.drawString(margin_x, y, line)
-        y -= line_height
+    spilled = None
+    if not isinstance(df, pd.DataFrame):
+        # chunk iterable: 1차로 임시 파일에 내리면서 폭 계산 -> df 는 컬럼 정보만 있는 빈 DataFrame
+        spilled, df, n_rows, col_widths = _spill_chunks(df, max_col_width, show_index, east_asian_width,
+                                                        tmp_dir=os.path.dirname(os.path.abspath(pdf_filename)))
+    else:
+        n_rows = len(df)
+        col_widths = [] if df.shape[1] == 0 else psql_column_widths(df, max_width=max_col_width, show_index=show_index,
+                                                                    east_asian_width=east_asian_width)
+    header_lines = [] if df.shape[1] == 0 else psql_header_lines(df, col_widths, show_index=show_index,
+                                                                 east_asian_width=east_asian_width)
+    rows_per_page = lines_per_page(height, margin_y, line_height, len(header_lines))
 
-    c.save()
+    # [5] PDF 생성
+    # 데이터 줄 = 행 수 + 아래 테두리 1줄. 페이지 수가 workers 보다 적으면 한 프로세스에서 처리
+    n_pages = -(-(n_rows + 1) // rows_per_page)
+    with stage('render_pdf', rows=n_rows, file=pdf_filename, pages=n_pages, workers=workers) as st:
+        if workers > 1 and spilled is None and df.shape[1] > 0 and n_pages > 1:
+            parts = min(workers, n_pages)
+            # part 경계는 항상 페이지 경계(rows_per_page 의 배수)이므로 각 part 의 페이지는 단일 프로세스 출력과 같음
+            bounds = [min(len(df), n_pages * i // parts * rows_per_page) for i in range(parts + 1)]
+            bounds[-1] = len(df)
+            out_dir = os.path.dirname(os.path.abspath(pdf_filename))
+            with tempfile.TemporaryDirectory(dir=out_dir) as tmp_dir:
+                with ProcessPoolExecutor(max_workers=parts) as executor:
+                    futures = [
+                        executor.submit(_render_part, os.path.join(tmp_dir, f"part_{i:04d}.pdf"),
+                                        df.iloc[bounds[i]:bounds[i + 1]], i == parts - 1, col_widths, header_lines,
+                                        max_col_width, show_index, east_asian_width, page_size, font_name, font_path,
+                                        font_size, line_height, margin_x, margin_y, rows_per_page)
+                        for i in range(parts)
+                    ]
+                    part_filenames = [f.result() for f in futures]
+                merge_pdfs(part_filenames, pdf_filename)
+            print(f"[INFO] {parts}개 부분 PDF 병합 ({n_pages} 페이지)")
+        else:
+            if df.shape[1] == 0:
+                data_lines = []
+            elif spilled is not None:
+                data_lines = _iter_spilled_lines(spilled, col_widths, max_width=max_col_width, show_index=show_index,
+                                                 chunk_rows=rows_per_page, east_asian_width=east_asian_width)
+            else:
+                data_lines = iter_psql_lines(df, col_widths, max_width=max_col_width, show_index=show_index,
+                                             chunk_rows=rows_per_page, east_asian_width=east_asian_width)
+            c = canvas.Canvas(pdf_filename, pagesize=page_size)
+            _draw_pages(c, header_lines, data_lines, font_name, font_size, height, margin_x, margin_y, line_height)
+            c.save()
+        if spilled is not None:
+            spilled.close()
+        st.add(bytes_written=file_size(pdf_filename))
     print(f"✅ PDF 저장 완료: {pdf_filename}")
 
-    # [6] 프린터 검사 및 출력
-    printers = [p[2] for p in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS)]
-    if target_printer not in printers:
-        raise ValueError(f"지정한 출력 프린터 '{target_printer}'가 시스템에 존재하지 않습니다.")
-
-    original_printer = win32print.GetDefaultPrinter()
-    print(f"[INFO] 원래 기본 프린터: {original_printer}")
-    print(f"[INFO] 임시 출력용 프린터: {target_printer}")
-
-    try:
-        win32print.SetDefaultPrinter(target_printer)
-        win32api.ShellExecute(0, "print", pdf_filename, None, ".", 0)
-        print("[INFO] 출력 명령 전송 완료.")
-    finally:
-        win32print.SetDefaultPrinter(original_printer)
-        print(f"[INFO] 기본 프린터 복원됨: {original_printer}")
\ No newline at end of file
+    # [6] 프린터 출력
+    with stage('send_pdf', file=pdf_filename, backend=type(backend).__name__):
+        backend.send(pdf_filename, target_printer)
\ No newline at end of file
@@ -1,40 +1,292 @@
-def summarize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    summary = []
-    total_rows = len(df)
-    total_columns = len(df.columns)
+import os
+import itertools
+import threading
+import numpy as np
+import pandas as pd
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from instrument import stage, instrumented, file_size
 
-    for col in df.columns:
-        col_data = df[col]
-        data_type = col_data.dtype
-        non_null_count = col_data.notna().sum()
-        null_count = col_data.isna().sum()
-        percent_null = (null_count / total_rows) * 100 if total_rows > 0 else np.nan
-        unique_count = col_data.nunique(dropna=True)
+try:
+    import pyarrow as pa     # optional: 문자열 컬럼 HyperLogLog hash 가속
+except ImportError:
+    pa = None
 
-        # Default values
-        min_val = max_val = sample_value = np.nan
+"""
+DataFrame 컬럼별 요약(dtype, null 수, 고유값 수, min/max, 샘플 값).
 
-        if pd.api.types.is_numeric_dtype(col_data) or pd.api.types.is_datetime64_any_dtype(col_data):
-            min_val = col_data.min(skipna=True)
-            max_val = col_data.max(skipna=True)
-
-        # Grab a sample non-null value for general types
-        non_nulls = col_data.dropna()
-        if not non_nulls.empty:
-            sample_value = non_nulls.iloc[0]
-
-        summary.append({
-            "Column": col,
-            "Data Type": str(data_type),
-            "Non-Null Count": non_null_count,
-            "Null Count": null_count,
-            "% Null": round(percent_null, 2),
-            "Unique Count": unique_count,
-            "Min": min_val,
-            "Max": max_val,
-            "Sample Value": sample_value,
-        })
+컬럼마다 통계를 한 번에 계산한다.
+- null mask 는 한 번만 만들어 null 수, non-null 수, 샘플 위치에 재사용 (notna/isna/dropna 반복 없음)
+- 샘플 값은 첫 번째 non-null 위치에서 바로 가져옴 (dropna 복사 없음)
+- 고유값 수는 unique() 한 번. 범위가 좁은 정수/bool 컬럼은 해시 대신 np.bincount
+컬럼들은 thread pool 에서 병렬로 처리할 수 있다.
+
+approx=True 이면 고유값 수를 HyperLogLog 로 추정한다(컬럼당 2**precision 바이트, 상대 표준오차 1.04 / sqrt(2**precision),
+precision=14 이면 16 KB, 약 0.8%, 99.7% 의 경우 ±2.4% 이내). 정확한 unique() 의 해시 테이블을 만들지 않으므로 메모리가 일정.
+
+메모리보다 큰 CSV/Parquet 는 SummaryAccumulator 로 chunk 단위 요약(null 수, min/max, HyperLogLog, reservoir sample)을
+누적하고, 병렬 worker 들의 부분 요약은 merge() 로 합친다.
+
+summary = summarize_dataframe(df, workers=8)
+summary = summarize_dataframe(df, approx=True)
+summary = summarize_file('extract.csv', chunksize=1_000_000, workers=4)
+"""
+
+# 정수 컬럼의 (max - min) 이 이 값 이하이면 해시 대신 bincount 로 고유값 수 계산
+BINCOUNT_MAX_RANGE = 1 << 22
+
+# 문자열 tabulation hash: 바이트 위치별 256 개 난수 table (64 위치씩 고정 seed 로 생성, 4096 바이트 이후는 위치 순환)
+_HASH_TABLE_BLOCK = 64
+_HASH_MAX_POSITION = 4096
+_hash_table_blocks = []
+_hash_table_lock = threading.Lock()
+
+
+def _count_unique(col_data: pd.Series, null_count: int, min_val, max_val) -> int:
+    dtype = col_data.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in 'iub' and len(col_data):
+        lo, hi = int(min_val), int(max_val)
+        if hi - lo <= BINCOUNT_MAX_RANGE:
+            values = col_data.to_numpy()
+            if dtype.kind == 'i':
+                offsets = values.astype(np.int64) - lo
+            else:
+                # unsigned / bool: subtract in the original dtype so large uint64 values don't wrap
+                values = values.view(np.uint8) if dtype.kind == 'b' else values
+                offsets = (values - values.dtype.type(lo)).astype(np.intp)
+            return int(np.count_nonzero(np.bincount(offsets)))
+    uniques = col_data.unique()
+    # unique() 는 결측값(None, NaN, NaT 등)도 포함하므로 제외
+    return len(uniques) - (int(pd.isna(uniques).sum()) if null_count else 0)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """uint64 배열의 원소별 bit 길이 (0 -> 0). 32 bit 씩 나눠 float64 frexp 로 정확하게 계산."""
+    hi = (values >> np.uint64(32)).astype(np.float64)
+    lo = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(hi > 0, 32 + np.frexp(hi)[1], np.frexp(lo)[1])
+
+
+def _hash_table(rows: int) -> np.ndarray:
+    rows = max(rows, 1)
+    with _hash_table_lock:
+        while len(_hash_table_blocks) * _HASH_TABLE_BLOCK < rows:
+            block = np.random.default_rng([0x5EED, len(_hash_table_blocks)])
+            _hash_table_blocks.append(block.integers(0, 2**64, size=(_HASH_TABLE_BLOCK, 256), dtype=np.uint64))
+    return np.concatenate(_hash_table_blocks[:-(-rows // _HASH_TABLE_BLOCK)])
+
+
+def _mix64(h: np.ndarray) -> np.ndarray:
+    # splitmix64 finalizer
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+def _hash_utf8(arr) -> np.ndarray:
+    """
+    Arrow 문자열 배열의 64 bit hash (vectorized tabulation hashing: 바이트마다 table[위치, 바이트] 를 XOR).
+    문자열마다 Python 객체를 만들지 않으므로 pd.util.hash_pandas_object 보다 몇 배 빠름. null 의 hash 는 의미 없음.
+    """
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    arr = arr.cast(pa.large_string())
+    buffers = arr.buffers()
+    offsets = np.frombuffer(buffers[1], dtype=np.int64)[arr.offset:arr.offset + len(arr) + 1]
+    data = (np.frombuffer(buffers[2], dtype=np.uint8)[offsets[0]:offsets[-1]] if buffers[2] is not None
+            else np.empty(0, dtype=np.uint8))
+    starts = offsets[:-1] - offsets[0]
+    lengths = np.diff(offsets)
+
+    table = _hash_table(min(int(lengths.max(initial=0)), _HASH_MAX_POSITION))
+    positions = np.arange(len(data), dtype=np.int64) - np.repeat(starts, lengths)
+    positions %= len(table)
+    hashes = np.zeros(len(arr), dtype=np.uint64)
+    non_empty = lengths > 0
+    if non_empty.any():
+        hashes[non_empty] = np.bitwise_xor.reduceat(table[positions, data], starts[non_empty])
+    return _mix64(hashes ^ (lengths.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)))
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """
+    HyperLogLog 용 64 bit hash. 문자열 컬럼(object/str)은 pyarrow 가 있으면 _hash_utf8, 그 외는 pd.util.hash_pandas_object.
+    같은 문자열은 object / Arrow str dtype 에 관계없이 같은 hash.
+    정수는 int64/uint64 그대로 hash (2**53 보다 큰 ID 도 구분), float 는 int64 범위의 정수값만 정수 hash 로
+    -> NaN 이 없는 chunk(int64)와 있는 chunk(float64)의 1 과 1.0 이 같은 hash.
+    """
+    if pd.api.types.is_integer_dtype(values.dtype):
+        # int64 와 uint64 는 같은 값(0 ~ 2**63-1)이 같은 bit -> 같은 hash. null 은 호출하는 쪽에서 제외
+        dtype = 'uint64' if pd.api.types.is_unsigned_integer_dtype(values.dtype) else 'int64'
+        return pd.util.hash_array(values.to_numpy(dtype=dtype, na_value=0))
+    if pd.api.types.is_float_dtype(values.dtype):
+        floats = values.to_numpy(dtype='float64', na_value=np.nan) + 0.0    # + 0.0 : -0.0 과 0.0 도 같은 값으로
+        hashes = pd.util.hash_array(floats)
+        integral = (floats >= -2.0 ** 63) & (floats < 2.0 ** 63) & (floats == np.floor(floats))
+        hashes[integral] = pd.util.hash_array(floats[integral].astype(np.int64))
+        return hashes
+    if pa is not None and (values.dtype == object or pd.api.types.is_string_dtype(values.dtype)):
+        try:
+            if values.dtype == object:
+                arr = pa.array(values.to_numpy(dtype=object), type=pa.large_string(), from_pandas=True)
+            else:
+                arr = pa.array(values.array, type=pa.large_string())
+            return _hash_utf8(arr)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass    # 문자열이 아닌 값이 섞인 object 컬럼
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+class HyperLogLog:
+    """
+    HyperLogLog 고유값 수 추정기 (64 bit hash, register 2**precision 개, uint8).
+    상대 표준오차 ≈ 1.04 / sqrt(2**precision) (precision=14: 약 0.8%). 같은 precision 끼리 merge() 가능(병렬/chunk 부분 결과 합치기).
+    값은 hash_values 로 hash (chunk 마다 int64 / float64 가 달라도 같은 정수값은 같은 hash).
+
+    Parameters:
+        precision (int): 4 ~ 18
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision}")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add(self, values: pd.Series, null_mask: np.ndarray | None = None, batch_rows: int = 200_000) -> "HyperLogLog":
+        """values 의 non-null 값들을 추가 (vectorized). null_mask 를 넘기면 isna 를 다시 계산하지 않음."""
+        if null_mask is None:
+            null_mask = values.isna().to_numpy(dtype=bool)
+        p = self.precision
+        # 행 batch 단위로 hash (문자열 hash 의 바이트 단위 임시 배열 크기 제한)
+        for start in range(0, len(values), batch_rows):
+            hashes = hash_values(values.iloc[start:start + batch_rows])[~null_mask[start:start + batch_rows]]
+            index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+            rest = hashes & np.uint64((1 << (64 - p)) - 1)
+            rank = (64 - p + 1 - _bit_length(rest)).astype(np.uint8)
+            np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> int:
+        """
+        Ertl (2017) 의 improved estimator: register 값 histogram 으로 계산하며, 작은/큰 cardinality 모두
+        별도 보정표(linear counting 전환 등) 없이 bias 가 거의 없음.
+        """
+        m = len(self.registers)
+        q = 64 - self.precision
+        counts = np.bincount(self.registers, minlength=q + 2).astype(np.float64)
+        if counts[0] == m:
+            return 0
+        z = m * _hll_tau(1 - counts[q + 1] / m)
+        for k in range(q, 0, -1):
+            z = 0.5 * (z + counts[k])
+        z += m * _hll_sigma(counts[0] / m)
+        return int(round(m * m / (2 * np.log(2) * z)))
+
+
+def _hll_sigma(x: float) -> float:
+    if x == 1:
+        return np.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        z_old = z
+        z += x * y
+        y += y
+        if z == z_old:
+            return z
+
+
+def _hll_tau(x: float) -> float:
+    if x == 0 or x == 1:
+        return 0.0
+    y, z = 1.0, 1 - x
+    while True:
+        x = np.sqrt(x)
+        z_old = z
+        y *= 0.5
+        z -= (1 - x) ** 2 * y
+        if z == z_old:
+            return z / 3
+
+
+@instrumented('profile_column')
+def profile_column(col_data: pd.Series, approx: bool = False, precision: int = 14) -> dict:
+    """
+    한 컬럼의 요약 통계.
+
+    Parameters:
+        col_data (pd.Series): 요약할 컬럼
+        approx (bool): 고유값 수를 HyperLogLog 로 추정
+        precision (int): HyperLogLog register 수 = 2**precision
+
+    Returns:
+        dict: summarize_dataframe 의 한 행 ("Column" 제외)
+    """
+    total_rows = len(col_data)
+    null_mask = col_data.isna().to_numpy(dtype=bool)
+    null_count = int(np.count_nonzero(null_mask))
+    percent_null = (null_count / total_rows) * 100 if total_rows > 0 else np.nan
+
+    # Default values
+    min_val = max_val = sample_value = np.nan
+
+    if pd.api.types.is_numeric_dtype(col_data) or pd.api.types.is_datetime64_any_dtype(col_data):
+        min_val = col_data.min(skipna=True)
+        max_val = col_data.max(skipna=True)
+
+    # First non-null value in row order
+    if null_count < total_rows:
+        sample_value = col_data.iloc[int(np.argmin(null_mask))]
+
+    return {
+        "Data Type": str(col_data.dtype),
+        "Non-Null Count": total_rows - null_count,
+        "Null Count": null_count,
+        "% Null": round(percent_null, 2),
+        "Unique Count": (HyperLogLog(precision).add(col_data, null_mask).estimate() if approx
+                         else _count_unique(col_data, null_count, min_val, max_val)),
+        "Min": min_val,
+        "Max": max_val,
+        "Sample Value": sample_value,
+    }
+
+
+@instrumented('summarize_dataframe')
+def summarize_dataframe(df: pd.DataFrame, workers: int | None = 1, approx: bool = False,
+                        precision: int = 14) -> pd.DataFrame:
+    """
+    DataFrame 컬럼별 요약표.
+
+    Parameters:
+        df (pd.DataFrame): 요약할 DataFrame
+        workers (int | None): 컬럼 병렬 처리 thread 수. None 이면 os.cpu_count(), 1 이면 순차 처리
+        approx (bool): 고유값 수를 HyperLogLog 로 추정 (Unique Count 가 근사값)
+        precision (int): HyperLogLog register 수 = 2**precision (approx=True 일 때)
 
+    Returns:
+        pd.DataFrame: 컬럼별 요약 (attrs 에 "Total Columns", "Total Rows")
+    """
+    total_rows = len(df)
+    total_columns = len(df.columns)
+    workers = workers or os.cpu_count() or 1
+
+    # positional access so duplicate column names are profiled separately
+    columns = [df.iloc[:, i] for i in range(total_columns)]
+    profile = partial(profile_column, approx=approx, precision=precision)
+    if workers > 1 and total_columns > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            profiles = list(executor.map(profile, columns))
+    else:
+        profiles = [profile(col_data) for col_data in columns]
+
+    summary = [{"Column": col, **profile} for col, profile in zip(df.columns, profiles)]
     summary_df = pd.DataFrame(summary)
     summary_df.index.name = "Column Index"
 
@@ -42,4 +294,234 @@ def summarize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     summary_df.attrs["Total Columns"] = total_columns
     summary_df.attrs["Total Rows"] = total_rows
 
-    return summary_df
\ No newline at end of file
+    return summary_df
+
+
+def _merge_extreme(a, b, func):
+    if pd.isna(a):
+        return b
+    if pd.isna(b):
+        return a
+    return func(a, b)
+
+
+class ColumnAccumulator:
+    """
+    한 컬럼의 chunk 단위 누적 요약: 행 수, null 수, min/max, 첫 non-null 값, HyperLogLog, reservoir sample.
+    메모리는 chunk 수와 무관(2**precision + sample_size). merge() 로 다른 chunk/worker 의 부분 결과를 합침.
+
+    reservoir sample 은 non-null 값마다 난수 key 를 붙여 key 가 가장 작은 sample_size 개를 유지(bottom-k)하므로
+    merge 후에도 전체 non-null 값에서 균등하게 비복원 추출한 것과 같음.
+
+    Parameters:
+        precision (int): HyperLogLog register 수 = 2**precision
+        sample_size (int): reservoir sample 크기
+        seed: np.random.default_rng 의 seed (None 이면 매번 다름)
+    """
+
+    def __init__(self, precision: int = 14, sample_size: int = 5, seed=None):
+        self.dtypes = []
+        self.rows = 0
+        self.nulls = 0
+        self.min = self.max = self.first = np.nan
+        self.has_first = False
+        self.hll = HyperLogLog(precision)
+        self.sample_size = sample_size
+        self._rng = np.random.default_rng(seed)
+        self._sample_keys = np.empty(0)
+        self._sample_values = np.empty(0, dtype=object)
+
+    def _add_samples(self, keys, values):
+        keys = np.concatenate([self._sample_keys, keys])
+        values = np.concatenate([self._sample_values, values])
+        keep = np.argsort(keys, kind='stable')[:self.sample_size]
+        self._sample_keys, self._sample_values = keys[keep], values[keep]
+
+    def update(self, col_data: pd.Series) -> "ColumnAccumulator":
+        dtype = str(col_data.dtype)
+        if dtype not in self.dtypes:
+            self.dtypes.append(dtype)
+        null_mask = col_data.isna().to_numpy(dtype=bool)
+        null_count = int(np.count_nonzero(null_mask))
+        self.rows += len(col_data)
+        self.nulls += null_count
+        if null_count == len(col_data):
+            return self
+
+        if pd.api.types.is_numeric_dtype(col_data) or pd.api.types.is_datetime64_any_dtype(col_data):
+            self.min = _merge_extreme(self.min, col_data.min(skipna=True), min)
+            self.max = _merge_extreme(self.max, col_data.max(skipna=True), max)
+
+        positions = np.flatnonzero(~null_mask)
+        if not self.has_first:
+            self.first, self.has_first = col_data.iloc[positions[0]], True
+
+        if self.sample_size > 0:
+            keys = self._rng.random(len(positions))
+            if len(keys) > self.sample_size:
+                pick = np.argpartition(keys, self.sample_size - 1)[:self.sample_size]
+                keys, positions = keys[pick], positions[pick]
+            self._add_samples(keys, col_data.iloc[positions].to_numpy(dtype=object))
+
+        self.hll.add(col_data, null_mask)
+        return self
+
+    def merge(self, other: "ColumnAccumulator") -> "ColumnAccumulator":
+        """other 를 이 accumulator 뒤에 이어진 chunk 로 보고 합침 (첫 non-null 값은 앞쪽 우선)."""
+        self.dtypes += [dtype for dtype in other.dtypes if dtype not in self.dtypes]
+        self.rows += other.rows
+        self.nulls += other.nulls
+        self.min = _merge_extreme(self.min, other.min, min)
+        self.max = _merge_extreme(self.max, other.max, max)
+        if not self.has_first and other.has_first:
+            self.first, self.has_first = other.first, True
+        self.hll.merge(other.hll)
+        self._add_samples(other._sample_keys, other._sample_values)
+        return self
+
+    def result(self) -> dict:
+        return {
+            "Data Type": " | ".join(self.dtypes),
+            "Non-Null Count": self.rows - self.nulls,
+            "Null Count": self.nulls,
+            "% Null": round((self.nulls / self.rows) * 100, 2) if self.rows > 0 else np.nan,
+            "Unique Count": self.hll.estimate(),
+            "Min": self.min,
+            "Max": self.max,
+            "Sample Value": self.first,
+            "Samples": self._sample_values.tolist(),
+        }
+
+
+class SummaryAccumulator:
+    """
+    DataFrame chunk 들의 누적 요약 (컬럼 이름별 ColumnAccumulator). chunk 마다 update(), worker 결과는 merge().
+
+    acc = SummaryAccumulator()
+    for chunk in pd.read_csv('big.csv', chunksize=1_000_000):
+        acc.update(chunk)
+    summary = acc.to_frame()
+    """
+
+    def __init__(self, precision: int = 14, sample_size: int = 5, seed=None):
+        self.precision = precision
+        self.sample_size = sample_size
+        self.seed = seed
+        self.columns = {}
+
+    def _column(self, col) -> ColumnAccumulator:
+        if col not in self.columns:
+            self.columns[col] = ColumnAccumulator(self.precision, self.sample_size, self.seed)
+        return self.columns[col]
+
+    def update(self, df: pd.DataFrame) -> "SummaryAccumulator":
+        for i, col in enumerate(df.columns):
+            self._column(col).update(df.iloc[:, i])
+        return self
+
+    def merge(self, other: "SummaryAccumulator") -> "SummaryAccumulator":
+        for col, acc in other.columns.items():
+            if col in self.columns:
+                self.columns[col].merge(acc)
+            else:
+                self.columns[col] = acc
+        return self
+
+    def to_frame(self) -> pd.DataFrame:
+        """summarize_dataframe 과 같은 형식의 요약표 + "Samples" 컬럼 (Unique Count 는 근사값)"""
+        summary = [{"Column": col, **acc.result()} for col, acc in self.columns.items()]
+        summary_df = pd.DataFrame(summary)
+        summary_df.index.name = "Column Index"
+        summary_df.attrs["Total Columns"] = len(self.columns)
+        summary_df.attrs["Total Rows"] = max((acc.rows for acc in self.columns.values()), default=0)
+        summary_df.attrs["Unique Count Relative Error"] = 1.04 / np.sqrt(1 << self.precision)
+        return summary_df
+
+
+def summarize_chunks(chunks, workers: int = 1, precision: int = 14, sample_size: int = 5, seed=None) -> pd.DataFrame:
+    """
+    DataFrame chunk iterable 을 누적 요약 (메모리는 chunk 크기 + 컬럼당 2**precision 바이트).
+
+    Parameters:
+        chunks (Iterable[pd.DataFrame]): 같은 컬럼/dtype 의 chunk 들 (예: pd.read_csv(chunksize=...))
+        workers (int): 1 보다 크면 chunk 를 workers 개씩 thread pool 에서 요약한 뒤 merge
+        precision (int): HyperLogLog register 수 = 2**precision
+        sample_size (int): 컬럼별 reservoir sample 크기
+        seed: 재현 가능한 sample 이 필요할 때 지정
+
+    Returns:
+        pd.DataFrame: SummaryAccumulator.to_frame() 결과
+    """
+    total = SummaryAccumulator(precision, sample_size, seed)
+    if workers <= 1:
+        for chunk in chunks:
+            total.update(chunk)
+        return total.to_frame()
+
+    def chunk_summary(item):
+        # chunk 마다 다른 난수열을 써야 bottom-k sample 이 chunk 사이에서 치우치지 않음
+        i, chunk = item
+        return SummaryAccumulator(precision, sample_size, None if seed is None else [seed, i]).update(chunk)
+
+    numbered = enumerate(chunks)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            # workers 개씩만 읽어서 메모리에 동시에 올라가는 chunk 수를 제한
+            batch = list(itertools.islice(numbered, workers))
+            if not batch:
+                break
+            for part in executor.map(chunk_summary, batch):
+                total.merge(part)
+    return total.to_frame()
+
+
+def summarize_file(path: str, chunksize: int = 1_000_000, workers: int = 1, precision: int = 14,
+                   sample_size: int = 5, seed=None, **read_kwargs) -> pd.DataFrame:
+    """
+    CSV/TSV/Parquet 파일을 chunk 단위로 읽으면서 요약 (파일 전체를 메모리에 올리지 않음).
+
+    Parameters:
+        path (str): 입력 파일. '.parquet'/'.pq' 는 pyarrow 로 row batch 단위, 그 외는 pd.read_csv(chunksize)
+        chunksize (int): chunk 행 수
+        workers, precision, sample_size, seed: summarize_chunks 참고
+        **read_kwargs: pd.read_csv 인자 (Parquet 는 columns 만 사용)
+
+    Returns:
+        pd.DataFrame: summarize_chunks 결과
+    """
+    ext = os.path.splitext(path)[1].lower()
+    with stage('summarize_file', file=path) as st:
+        st.add(bytes_read=file_size(path))
+        if ext in ('.parquet', '.pq'):
+            import pyarrow.parquet as pq
+
+            batches = pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=read_kwargs.get('columns'))
+            summary = summarize_chunks((batch.to_pandas() for batch in batches), workers, precision, sample_size, seed)
+        else:
+            read_kwargs.setdefault('sep', '\t' if ext in ('.tsv', '.tab', '.txt') else ',')
+            with pd.read_csv(path, chunksize=chunksize, **read_kwargs) as reader:
+                summary = summarize_chunks(reader, workers, precision, sample_size, seed)
+        st.add(rows=summary.attrs.get("Total Rows"))
+    return summary
+
+
+if __name__ == "__main__":
+    # HyperLogLog hash parity: int64 chunk 와 NaN 이 섞인 float64 chunk 의 같은 값은 같은 hash,
+    # 2**53 보다 큰 정수 ID 는 서로 다른 hash
+    ints = pd.Series([0, 1, -5, 2 ** 53 - 1, 20250301], dtype='int64')
+    floats = pd.Series([0.0, 1.0, -5.0, 2.0 ** 53 - 1, 20250301.0, np.nan, -0.0, 0.5], dtype='float64')
+    same = np.array_equal(hash_values(ints), hash_values(floats)[:5]) and hash_values(floats)[6] == hash_values(ints)[0]
+    same &= np.array_equal(hash_values(ints), hash_values(ints.astype('Int64'))) and \
+        np.array_equal(hash_values(ints[ints >= 0]), hash_values(ints[ints >= 0].astype('uint64')))
+    print(f"int/float chunk hash        {'OK' if same else 'MISMATCH'}")
+
+    large = pd.Series(np.arange(200_000, dtype=np.int64) + 10 ** 18)
+    cases = {
+        'sequential ids from 10**18': (large, 200_000),
+        'uint64 [2**64-1, 2**64-2]': (pd.Series([2 ** 64 - 1, 2 ** 64 - 2], dtype='uint64'), 2),
+        'int64 around 2**53': (pd.Series([2 ** 53, 2 ** 53 + 1, 2 ** 53 + 2], dtype='int64'), 3),
+    }
+    for name, (values, expected) in cases.items():
+        estimate = HyperLogLog().add(values, values.isna().to_numpy()).estimate()
+        ok = abs(estimate - expected) <= max(1, 0.03 * expected)
+        print(f"{name:27s} {estimate:>9,} (expected {expected:,}) {'OK' if ok else 'MISMATCH'}")
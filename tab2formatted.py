@@ -2,18 +2,51 @@ import pandas as pd
 import numpy as np
 import json
 import os
+import re
+import hashlib
+from contextlib import contextmanager, ExitStack
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import instrument
+from instrument import stage, instrumented, file_size
+
+try:
+    import orjson     # optional: JSON Lines 출력 가속
+except ImportError:
+    orjson = None
+try:
+    import pyarrow as pa    # optional: columnar binary(.feather) 출력
+except ImportError:
+    pa = None
 
 """
 TAB으로 구분된 여러 파일을 CSV, JSON, Python dict(.py)로 일괄 변환하는 배치 스크립트.
-jobfilelist.txt 내 파일들을 순차적으로 변환함.
+jobfilelist.txt 내 파일들을 process pool 로 병렬 변환함.
+manifest(입력 파일 size/mtime/hash, 출력 파일 size)를 저장해 두고, 다음 실행 때 변경되지 않은 입력은 건너뜀.
+모든 출력 파일은 임시 파일에 쓴 뒤 교체(atomic)하므로 중간 실패 시 깨진 파일이 남지 않음.
 TAB으로 구분된 파일을 CSV로 변환하고, CSV를 JSON, Python dict(.py)로 변환하는 스크립트입니다.
 1. TAB으로 구분된 파일을 읽어들입니다.
 2. 각 셀에서 콤마를 제거하고, 그것이 숫자인 경우 소수점 이하가 0이면 정수로 변환하여 저장함.
 3. 변환된 데이터를 CSV 파일로 저장합니다.
 4. CSV 파일을 formatted JSON 파일로 변환합니다.
 5. CSV 파일을 Python dict 형태로 변환하여 .py 파일로 저장합니다.
+6. pyarrow 가 설치되어 있으면 같은 데이터를 columnar binary(.feather, Arrow IPC, 비압축)로도 저장합니다.
+   dict2df.load_converted() 가 memory-map 으로 바로 읽으므로 거대한 .py 모듈을 import 할 필요가 없습니다.
 """
 
+@contextmanager
+def atomic_open(path, mode='w', **kwargs):
+    """임시 파일에 쓰고 성공 시에만 path 로 교체(os.replace). 실패하면 임시 파일 삭제."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+# convert_commas / format_numbers: 셀 단위 기준 구현(normalize_numbers 결과 비교용)
 def convert_commas(value):
     if isinstance(value, str) and value.replace(',', '').isdigit():
         return float(value.replace(',', ''))
@@ -24,13 +57,189 @@ def format_numbers(value):
         return int(value)
     return value
 
-def csv_to_json(csv_filename, json_filename, indent=4):
-    df = pd.read_csv(csv_filename, dtype=str)
-    # DataFrame의 NaN/None은 json.dump시 null로 자동 변환됨
-    # 빈 문자열("")은 그대로 출력
-    records = df.where(pd.notnull(df), None).to_dict(orient='records')
-    with open(json_filename, 'w', encoding='utf-8') as jsonf:
-        json.dump(records, jsonf, indent=indent, ensure_ascii=False)
+def _number_pattern(thousands, decimal, currency_symbols):
+    t, d = re.escape(thousands), re.escape(decimal)
+    symbols = '|'.join(re.escape(sym) for sym in currency_symbols)
+    prefix = rf'(?:{symbols})?\s*' if symbols else ''
+    return rf'^\s*{prefix}([+-]?(?:\d{{1,3}}(?:{t}\d{{3}})+|\d+)(?:{d}\d+)?)\s*$'
+
+def normalize_number_column(series, thousands=',', decimal=None, currency_symbols=()):
+    """
+    convert_commas + format_numbers 를 컬럼 단위로 한 번에 적용(vectorized).
+
+    Parameters:
+        series (pd.Series): 변환할 컬럼
+        thousands (str): 천 단위 구분자
+        decimal (str | None): None 이면 기존 규칙(구분자 제거 후 숫자만 있는 셀만 변환)과 동일.
+            지정하면(예: ',') 소수/부호/통화 기호가 있는 숫자도 변환. 예) "R$ 45.512,00" -> 45512
+        currency_symbols (Iterable[str]): decimal 지정 시 앞에 붙어도 되는 통화 기호 (예: ['R$', '₩'])
+
+    Returns:
+        pd.Series: 숫자 셀은 float 변환 후 정수값이면 int, 나머지 셀은 그대로
+    """
+    if pd.api.types.is_float_dtype(series):
+        if len(series) and series.notna().all() and (series % 1 == 0).all():
+            return series.astype('int64')
+        return series
+    if pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+        # 문자열이 아닌 값이 섞인 컬럼은 셀 단위 기준 구현으로 처리
+        return series.map(convert_commas).map(format_numbers)
+
+    if decimal is None:
+        cleaned = series.str.replace(thousands, '', regex=False)
+        numeric = cleaned.str.isdigit().eq(True).to_numpy()
+    else:
+        cleaned = series.str.extract(_number_pattern(thousands, decimal, currency_symbols), expand=False)
+        cleaned = cleaned.str.replace(thousands, '', regex=False).str.replace(decimal, '.', regex=False)
+        numeric = cleaned.notna().to_numpy()
+    if not numeric.any():
+        return series
+
+    floats = cleaned[numeric].astype(object).astype('float64').to_numpy()
+    values = floats.astype(object)
+    # 정수값은 int 로 (format_numbers), int64 범위 밖은 Python int
+    integral = floats % 1 == 0
+    in_range = integral & (np.abs(floats) < 2 ** 63)
+    values[in_range] = floats[in_range].astype(np.int64).astype(object)
+    big = integral & ~in_range
+    values[big] = [int(v) for v in floats[big]]
+
+    out = series.to_numpy(dtype=object, copy=True)
+    out[numeric] = values
+    # DataFrame.map 과 같은 dtype 추론 (int+NaN -> float64, 전부 int -> int64, 문자열 섞이면 object)
+    return pd.Series(out, index=series.index, name=series.name).infer_objects()
+
+def normalize_numbers(df, thousands=',', decimal=None, currency_symbols=()):
+    """DataFrame 전체에 normalize_number_column 적용 (df.map(convert_commas).map(format_numbers) 대체)"""
+    out = df.copy(deep=False)
+    for i in range(df.shape[1]):
+        with stage('normalize_number_column', rows=len(df), column=df.columns[i]):
+            out.isetitem(i, normalize_number_column(df.iloc[:, i], thousands, decimal, currency_symbols))
+    return out
+
+def frame_to_text(df):
+    """
+    DataFrame 을 CSV 로 저장한 뒤 dtype=str 로 다시 읽은 것과 같은 object DataFrame 으로 변환.
+    값은 CSV 에 쓰이는 문자열 그대로, NaN/None 은 None.
+    """
+    return df.astype(str).astype(object).where(df.notna(), None)
+
+def frame_to_records(df):
+    """frame_to_text 결과를 records(list of dict)로 변환"""
+    return frame_to_text(df).to_dict(orient='records')
+
+def iter_frame_records(df, chunksize=100_000):
+    """frame_to_records 를 chunksize 행 단위로 나눠 생성(records 전체를 한 번에 만들지 않음)"""
+    for start in range(0, len(df), chunksize):
+        yield frame_to_records(df.iloc[start:start + chunksize])
+
+def iter_csv_records(csv_filename, chunksize=100_000):
+    """CSV 를 chunk 단위로 읽어 records(list of dict, NaN -> None) 생성"""
+    with pd.read_csv(csv_filename, dtype=str, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield chunk.astype(object).where(pd.notnull(chunk), None).to_dict(orient='records')
+
+_encode_json_str = json.encoder.encode_basestring   # ensure_ascii=False 일 때 json 이 쓰는 문자열 encoder
+
+class JsonRecordWriter:
+    """
+    records 를 받는 대로 이어 쓰는 JSON writer. 출력은 json.dump(records, indent=indent) 와 동일.
+    lines=True 이면 JSON Lines(한 줄에 record 하나, 압축 형식)로 쓰고, orjson 이 있으면 사용.
+    """
+
+    def __init__(self, f, indent=4, lines=False):
+        self.f = f
+        self.indent = indent
+        self.lines = lines
+        self.count = 0
+        self._pad = ' ' * indent if indent is not None else None
+
+    def _encode(self, row):
+        if self.lines:
+            if orjson is not None:
+                return orjson.dumps(row).decode('utf-8')
+            return json.dumps(row, ensure_ascii=False, separators=(',', ':'))
+        if self._pad is not None:
+            text = self._encode_flat(row)
+            if text is not None:
+                return text
+        text = json.dumps(row, indent=self.indent, ensure_ascii=False)
+        if self._pad is None:
+            return text
+        return '\n'.join(self._pad + line for line in text.split('\n'))
+
+    def _encode_flat(self, row):
+        # 값이 문자열/None 뿐인 record 는 json.dumps(indent=...) 와 같은 문자열을 직접 조립(빠름)
+        if not row:
+            return self._pad + '{}'
+        inner = self._pad * 2
+        parts = []
+        for key, val in row.items():
+            if not isinstance(key, str):
+                return None
+            if val is None:
+                val = 'null'
+            elif isinstance(val, str):
+                val = _encode_json_str(val)
+            else:
+                return None
+            parts.append(f"{inner}{_encode_json_str(key)}: {val}")
+        return f"{self._pad}{{\n" + ',\n'.join(parts) + f"\n{self._pad}}}"
+
+    def write(self, records):
+        f = self.f
+        for row in records:
+            if self.lines:
+                f.write(self._encode(row) + '\n')
+            else:
+                if self.count == 0:
+                    f.write('[\n' if self._pad is not None else '[')
+                else:
+                    f.write(',\n' if self._pad is not None else ', ')
+                f.write(self._encode(row))
+            self.count += 1
+
+    def close(self):
+        if self.lines:
+            return
+        if self.count == 0:
+            self.f.write('[]')
+        else:
+            self.f.write('\n]' if self._pad is not None else ']')
+
+class PythonDictWriter:
+    """records 를 받는 대로 'dict = [...]' 형식의 .py 파일에 이어 쓰는 writer"""
+
+    def __init__(self, f):
+        self.f = f
+        f.write('dict = \\\n[\n')
+
+    def write(self, records):
+        self.f.write(''.join(f"    {row},\n" for row in records))
+
+    def close(self):
+        self.f.write(']\n')
+
+def write_json(record_chunks, json_filename, indent=4, lines=False):
+    """record_chunks: records(list of dict)를 생성하는 iterable"""
+    # None은 json 의 null로 변환됨, 빈 문자열("")은 그대로 출력
+    with atomic_open(json_filename, 'w', encoding='utf-8') as jsonf:
+        writer = JsonRecordWriter(jsonf, indent=indent, lines=lines)
+        for records in record_chunks:
+            writer.write(records)
+        writer.close()
+
+def write_python_dict(record_chunks, py_filename):
+    """record_chunks: records(list of dict)를 생성하는 iterable"""
+    with atomic_open(py_filename, 'w', encoding='utf-8') as pyf:
+        writer = PythonDictWriter(pyf)
+        for records in record_chunks:
+            writer.write(records)
+        writer.close()
+
+def csv_to_json(csv_filename, json_filename, indent=4, lines=False, chunksize=100_000):
+    # CSV 를 chunk 단위로 읽어 바로 쓰므로 메모리 사용량은 chunk 크기에 비례
+    write_json(iter_csv_records(csv_filename, chunksize), json_filename, indent=indent, lines=lines)
     print(f"{csv_filename} -> {json_filename} 변환 완료!")
 
 def replace_nan_with_none(obj):
@@ -44,42 +253,188 @@ def replace_nan_with_none(obj):
     else:
         return obj
 
-def csv_to_python_dict(csv_filename, py_filename):
-    df = pd.read_csv(csv_filename, dtype=str)
-    dict_list = df.where(pd.notnull(df), None).to_dict(orient='records')
-    dict_list = replace_nan_with_none(dict_list)
-    with open(py_filename, 'w', encoding='utf-8') as pyf:
-        pyf.write('dict = \\\n[\n')
-        for row in dict_list:
-            pyf.write(f"    {row},\n")
-        pyf.write(']\n')
+def csv_to_python_dict(csv_filename, py_filename, chunksize=100_000):
+    # iter_csv_records 가 이미 NaN -> None 으로 변환하므로 replace_nan_with_none 불필요
+    write_python_dict(iter_csv_records(csv_filename, chunksize), py_filename)
     print(f"{csv_filename} -> {py_filename} 변환 완료!")
 
-def tab_to_csv_json_py(tab_file):
+def output_paths(tab_file):
+    """tab_to_csv_json_py 가 쓰는 출력 파일 경로 [csv, json, py(, feather: pyarrow 설치 시)]"""
     base, _ = os.path.splitext(tab_file)
-    csv_file = f"{base}_converted.csv"
-    json_file = f"{base}_converted_json_formatted.json"
-    python_dict_file = f"{base}_converted_python_dict.py"
-    # TAB 파일 읽기
-    df = pd.read_csv(tab_file, sep='\t', dtype=str)
-    df = df.map(convert_commas)
-    df = df.map(format_numbers)
-    df.to_csv(csv_file, index=False)
-    csv_to_json(csv_file, json_file)
-    csv_to_python_dict(csv_file, python_dict_file)
-
-def batch_process(jobfilelist_path):
+    paths = [f"{base}_converted.csv", f"{base}_converted_json_formatted.json", f"{base}_converted_python_dict.py"]
+    if pa is not None:
+        paths.append(f"{base}_converted.feather")
+    return paths
+
+def tab_to_csv_json_py(tab_file, chunksize=100_000):
+    """
+    TAB 파일을 한 번만 읽어 CSV, JSON, Python dict(.py), (pyarrow 설치 시) Feather 로 동시에 출력.
+    JSON/.py/Feather 는 저장한 CSV 를 다시 읽지 않고, 같은 데이터를 chunk 단위로 각 writer 에 함께 씀.
+    """
+    csv_file, json_file, python_dict_file, *feather = output_paths(tab_file)
+    with stage('tab_to_csv_json_py', file=tab_file) as job:
+        # TAB 파일 읽기
+        with stage('read_tab', file=tab_file) as st:
+            df = pd.read_csv(tab_file, sep='\t', dtype=str)
+            st.add(rows=len(df), bytes_read=file_size(tab_file))
+        job.add(rows=len(df), bytes_read=file_size(tab_file))
+        with stage('normalize_numbers', rows=len(df), file=tab_file):
+            df = normalize_numbers(df)
+        with stage('write_csv', rows=len(df), file=csv_file) as st:
+            with atomic_open(csv_file, 'w', encoding='utf-8', newline='') as csvf:
+                df.to_csv(csvf, index=False)
+            st.add(bytes_written=file_size(csv_file))
+
+        outputs = [csv_file, json_file, python_dict_file]
+        with stage('write_json_py_feather', rows=len(df), file=tab_file) as st:
+            with ExitStack() as stack:
+                json_writer = JsonRecordWriter(stack.enter_context(atomic_open(json_file, 'w', encoding='utf-8')))
+                py_writer = PythonDictWriter(stack.enter_context(atomic_open(python_dict_file, 'w', encoding='utf-8')))
+                arrow_writer = None
+                if feather:
+                    feather_file = feather[0]
+                    # 모든 컬럼을 string 으로 저장(.py 의 dict 값과 동일), 비압축이라 memory-map 시 zero-copy
+                    schema = pa.schema([(str(col), pa.string()) for col in df.columns])
+                    featherf = stack.enter_context(atomic_open(feather_file, 'wb'))
+                    arrow_writer = stack.enter_context(pa.ipc.new_file(featherf, schema))
+                    outputs.append(feather_file)
+                for start in range(0, len(df), chunksize):
+                    text = frame_to_text(df.iloc[start:start + chunksize])
+                    records = text.to_dict(orient='records')
+                    json_writer.write(records)
+                    py_writer.write(records)
+                    if arrow_writer is not None:
+                        arrow_writer.write_table(pa.Table.from_pandas(text, schema=schema, preserve_index=False))
+                json_writer.close()
+                py_writer.close()
+            st.add(bytes_written=sum(file_size(p) or 0 for p in outputs[1:]))
+        job.add(bytes_written=sum(file_size(p) or 0 for p in outputs))
+
+    for out_file in outputs[1:]:
+        print(f"{tab_file} -> {out_file} 변환 완료!")
+    return outputs
+
+def file_sha256(path, block_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def _file_stat(path):
+    st = os.stat(path)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+def is_up_to_date(tab_file, entry):
+    """manifest entry 기준으로 입력/출력 파일이 변경되지 않았으면 True (지금 만들 출력이 entry 에 없으면 False)"""
+    if not entry:
+        return False
+    outputs = entry.get('outputs', {})
+    # 기록 이후 출력 종류가 늘어난 경우(예: pyarrow 설치 후 .feather) 다시 변환
+    if set(outputs) != {os.path.abspath(p) for p in output_paths(tab_file)}:
+        return False
+    # 출력은 hash 가 없으므로 크기와 mtime 이 모두 기록과 같아야 함(덮어쓰기/touch/복원 등은 다시 변환)
+    for out_path, out_stat in outputs.items():
+        if not os.path.exists(out_path) or _file_stat(out_path) != out_stat:
+            return False
+    stat = _file_stat(tab_file)
+    if stat['size'] != entry['size']:
+        return False
+    # mtime 이 같으면 hash 계산 생략, 다르면(touch 등) 내용 hash 로 확인
+    return stat['mtime_ns'] == entry['mtime_ns'] or file_sha256(tab_file) == entry['sha256']
+
+def convert_job(tab_file, instrument_memory=None):
+    """
+    process pool 작업 단위: 변환 후 manifest entry 반환.
+    instrument_memory 가 None 이 아니면 자식 프로세스에서 계측하고 기록을 entry['instrument'] 로 돌려줌.
+    """
+    if instrument_memory is not None:
+        with instrument.recording(memory=instrument_memory) as rec:
+            entry = convert_job(tab_file)
+        return {**entry, 'instrument': rec.records}
+    stat = _file_stat(tab_file)
+    sha256 = file_sha256(tab_file)
+    outputs = tab_to_csv_json_py(tab_file)
+    return {**stat, 'sha256': sha256, 'outputs': {os.path.abspath(p): _file_stat(p) for p in outputs}}
+
+def load_manifest(manifest_path):
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+def save_manifest(manifest, manifest_path):
+    with atomic_open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+@instrumented('batch_process')
+def batch_process(jobfilelist_path, workers=None, manifest_path=None, force=False):
+    """
+    jobfilelist 의 TAB 파일들을 병렬로 변환. 변경되지 않은 입력은 manifest 를 보고 건너뜀.
+    manifest 는 파일 하나가 끝날 때마다 저장 (중단돼도 끝난 파일은 다음 실행에서 건너뜀).
+
+    Parameters:
+        jobfilelist_path (str): 변환할 TAB 파일 경로 목록(한 줄에 하나)
+        workers (int | None): process 개수 (None: CPU 개수, 1: 현재 프로세스에서 순차 실행)
+        manifest_path (str | None): manifest JSON 경로 (기본: '<jobfilelist_path>.manifest.json')
+        force (bool): True 이면 manifest 와 무관하게 전부 다시 변환
+
+    Returns:
+        dict: {'converted': [...], 'skipped': [...], 'failed': [...], 'missing': [...]}
+    """
     with open(jobfilelist_path, 'r', encoding='utf-8') as f:
         files = [line.strip() for line in f if line.strip()]
-    for tab_file in files:
-        if os.path.exists(tab_file):
-            print(f"처리 시작: {tab_file}")
-            try:
-                tab_to_csv_json_py(tab_file)
-            except Exception as e:
-                print(f"파일 처리 중 오류 발생: {tab_file} ({e})")
-        else:
+    manifest_path = manifest_path or f"{jobfilelist_path}.manifest.json"
+    manifest = load_manifest(manifest_path)
+    result = {'converted': [], 'skipped': [], 'failed': [], 'missing': []}
+
+    todo = []
+    for tab_file in dict.fromkeys(files):
+        key = os.path.abspath(tab_file)
+        if not os.path.exists(tab_file):
             print(f"파일 없음: {tab_file}")
+            result['missing'].append(tab_file)
+        elif not force and is_up_to_date(tab_file, manifest.get(key)):
+            print(f"변경 없음, 건너뜀: {tab_file}")
+            manifest[key].update(_file_stat(tab_file))   # hash 일치 시 mtime 갱신(다음 실행에서 hash 생략)
+            result['skipped'].append(tab_file)
+        else:
+            todo.append(tab_file)
+
+    def finish(tab_file, job):
+        key = os.path.abspath(tab_file)
+        try:
+            entry = job()
+            instrument.extend(entry.pop('instrument', None))
+            manifest[key] = entry
+            result['converted'].append(tab_file)
+        except Exception as e:
+            manifest.pop(key, None)
+            result['failed'].append(tab_file)
+            print(f"파일 처리 중 오류 발생: {tab_file} ({e})")
+        save_manifest(manifest, manifest_path)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(todo) <= 1:
+        for tab_file in todo:
+            print(f"처리 시작: {tab_file}")
+            finish(tab_file, lambda: convert_job(tab_file))
+    else:
+        # 계측 중이면 자식 프로세스도 계측해서 기록을 돌려받음
+        rec = instrument.current()
+        memory = rec.memory if rec is not None else None
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for tab_file in todo:
+                print(f"처리 시작: {tab_file}")
+                futures[executor.submit(convert_job, tab_file, memory)] = tab_file
+            for future in as_completed(futures):
+                finish(futures[future], future.result)
+
+    save_manifest(manifest, manifest_path)
+    print(f"변환 {len(result['converted'])}건, 건너뜀 {len(result['skipped'])}건, "
+          f"실패 {len(result['failed'])}건, 파일 없음 {len(result['missing'])}건")
+    return result
 
 if __name__ == "__main__":
     input_file_list = "jobfilelist.txt"
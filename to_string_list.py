@@ -1,6 +1,200 @@
 import numpy as np
 import pandas as pd
-from typing import Any, List
+from typing import Any, Iterator, List
+
+# iter_string_list 가 큰 배열/DataFrame 을 문자열로 바꿀 때 한 번에 처리하는 원소 수
+CHUNK_SIZE = 1 << 16
+
+# scalar 들을 이 개수 이상 모았을 때만 pd.isna 로 한 번에 null 판정 (적으면 _is_null 이 더 빠름)
+VECTOR_MIN_RUN = 256
+
+_ARRAY_TYPES = (np.ndarray, pd.Series, pd.DataFrame)
+_CONTAINER_TYPES = (list, tuple) + _ARRAY_TYPES
+_PLAIN_TYPES = frozenset((str, int, bool))
+
+
+def _is_null(val: Any) -> bool:
+    """scalar 의 null 여부 (None, NaN, NaT, pd.NA). list/tuple/배열 등 container 는 null 이 아님."""
+    if val is None:
+        return True
+    if type(val) is float:
+        return val != val
+    if type(val) in _PLAIN_TYPES or isinstance(val, _CONTAINER_TYPES):
+        return False
+    try:
+        return bool(pd.isna(val))
+    except (TypeError, ValueError):
+        return False
+
+
+def _as_text(data: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    # pandas 3 의 str dtype 은 결측값을 NaN 으로 남기므로 str(x) 와 같게 'nan' 으로 채움
+    text = data.astype(str)
+    return text.fillna('nan') if text.isna().to_numpy().any() else text
+
+
+def _str_list(flat: np.ndarray) -> List[str]:
+    """1차원 배열 -> 문자열 list. int/bool/float64 는 tolist() 후 str (NumPy 의 astype(str) 와 같은 결과, 더 빠름)"""
+    if flat.dtype.kind in 'iub' or flat.dtype == np.float64:
+        return list(map(str, flat.tolist()))
+    return flat.astype(str).tolist()
+
+
+def _array_strings(arr: np.ndarray, keep_none: bool) -> list:
+    """ndarray: keep_none 이면 모양 그대로(astype(str).tolist() 와 같은 중첩 list), 아니면 null 을 뺀 1차원 list"""
+    if not keep_none:
+        flat = arr.ravel()
+        return _str_list(flat[~pd.isna(flat)])
+    if arr.ndim == 0:
+        return arr.astype(str).tolist()
+    if arr.ndim == 1:
+        return _str_list(arr)
+    return np.array(_str_list(arr.ravel()), dtype=object).reshape(arr.shape).tolist()
+
+
+def _leaf_strings(val: Any, keep_none: bool) -> list:
+    """list/tuple 이 아닌 값 하나를 문자열 list 로 (pandas/NumPy 는 vectorized)"""
+    if isinstance(val, pd.DataFrame):
+        return _as_text(val if keep_none else val.dropna()).to_numpy().tolist()
+    if isinstance(val, pd.Series):
+        return _as_text(val if keep_none else val.dropna()).tolist()
+    if isinstance(val, np.ndarray):
+        return _array_strings(val, keep_none)
+    return [str(val)] if (keep_none or not _is_null(val)) else []
+
+
+def _scalar_strings(run: list, keep_none: bool) -> List[str]:
+    """list/tuple 안의 연속된 scalar 들을 한 번에 변환 (많으면 null 판정은 pd.isna 1회)"""
+    if not keep_none:
+        if len(run) >= VECTOR_MIN_RUN:
+            values = np.empty(len(run), dtype=object)
+            values[:] = run
+            run = values[~pd.isna(values)].tolist()
+        else:
+            run = [v for v in run if not _is_null(v)]
+    return list(map(str, run))
+
+
+def _is_container(val: Any) -> bool:
+    return isinstance(val, _CONTAINER_TYPES)
+
+
+# _walk 이벤트 종류
+_SCALARS, _LEAF, _ENTER, _EXIT = range(4)
+
+
+def _walk(x: list | tuple, max_run: int | None = None) -> Iterator[tuple]:
+    """
+    list/tuple 중첩 구조를 재귀 없이(명시적 stack) 순회하며 이벤트를 yield.
+    (_SCALARS, [연속된 scalar 들]), (_LEAF, NumPy/pandas 값), (_ENTER, None) / (_EXIT, None): 하위 list/tuple 시작/끝.
+    max_run 을 주면 연속된 scalar 를 최대 max_run 개씩 끊어서 보냄.
+    """
+    stack = [iter(x)]
+    while stack:
+        run = []
+        for item in stack[-1]:
+            if not isinstance(item, _CONTAINER_TYPES):
+                run.append(item)
+                if max_run is not None and len(run) >= max_run:
+                    yield _SCALARS, run
+                    run = []
+                continue
+            if run:
+                yield _SCALARS, run
+                run = []
+            if isinstance(item, (list, tuple)):
+                yield _ENTER, None
+                if any(isinstance(i, _CONTAINER_TYPES) for i in item):
+                    stack.append(iter(item))
+                    break
+                # scalar 만 있는 list/tuple (가장 흔한 경우): 항목별 검사 없이 통째로
+                step = max_run or len(item) or 1
+                for start in range(0, len(item), step):
+                    yield _SCALARS, item[start:start + step]
+                yield _EXIT, None
+                continue
+            yield _LEAF, item
+        else:
+            if run:
+                yield _SCALARS, run
+            stack.pop()
+            if stack:
+                yield _EXIT, None
+
+
+def _nested_strings(x: Any, keep_none: bool) -> list:
+    """list/tuple 중첩 구조를 유지하며 변환 (list 안의 scalar 하나는 ['값'] 으로)"""
+    if not isinstance(x, (list, tuple)):
+        return _leaf_strings(x, keep_none)
+    outputs = [[]]
+    for kind, value in _walk(x):
+        if kind == _SCALARS:
+            outputs[-1].extend([[s] for s in _scalar_strings(value, keep_none)])
+        elif kind == _LEAF:
+            outputs[-1].append(_leaf_strings(value, keep_none))
+        elif kind == _ENTER:
+            child = []
+            outputs[-1].append(child)
+            outputs.append(child)
+        else:
+            outputs.pop()
+    return outputs[0]
+
+
+def _iter_leaf(val: Any, keep_none: bool) -> Iterator[str]:
+    """NumPy/pandas 값을 CHUNK_SIZE 씩 문자열로 바꿔 yield (C 순서, DataFrame 은 행 우선)"""
+    if isinstance(val, pd.DataFrame):
+        frame = val if keep_none else val.dropna()
+        rows = max(1, CHUNK_SIZE // max(1, frame.shape[1]))
+        for start in range(0, len(frame), rows):
+            yield from _as_text(frame.iloc[start:start + rows]).to_numpy().ravel().tolist()
+    elif isinstance(val, pd.Series):
+        series = val if keep_none else val.dropna()
+        for start in range(0, len(series), CHUNK_SIZE):
+            yield from _as_text(series.iloc[start:start + CHUNK_SIZE]).tolist()
+    else:
+        flat = val.ravel()      # C-contiguous 이면 복사 없음
+        for start in range(0, len(flat), CHUNK_SIZE):
+            chunk = flat[start:start + CHUNK_SIZE]
+            if not keep_none:
+                chunk = chunk[~pd.isna(chunk)]
+            yield from _str_list(chunk)
+
+
+def iter_string_list(x: Any, keep_none: bool = True) -> Iterator[str]:
+    """
+    to_string_list(x, flatten=True) 의 lazy generator 버전.
+    중간 list 를 만들지 않고 문자열을 하나씩 yield 하며, 큰 배열/DataFrame 은 CHUNK_SIZE 씩 나눠 변환한다.
+
+    Parameters:
+    -----------
+    x : Any
+        Input data. Can be scalar, list, tuple, NumPy array, Pandas Series or DataFrame.
+    keep_none : bool, default=True
+        If False, skips None, NaN, and null-like values.
+
+    Yields:
+    -------
+    str
+
+    Examples:
+    ---------
+    >>> list(iter_string_list([[1, 2], [3, None]], keep_none=False))
+    ['1', '2', '3']
+    """
+    if not isinstance(x, (list, tuple)):
+        if _is_container(x):
+            yield from _iter_leaf(x, keep_none)
+        elif keep_none or not _is_null(x):
+            yield str(x)
+        return
+
+    for kind, value in _walk(x, max_run=CHUNK_SIZE):
+        if kind == _SCALARS:
+            yield from _scalar_strings(value, keep_none)
+        elif kind == _LEAF:
+            yield from _iter_leaf(value, keep_none)
+
 
 def to_string_list(x: Any, flatten: bool = False, keep_none: bool = True) -> List[str] | List[List[str]]:
     """
@@ -8,12 +202,15 @@ def to_string_list(x: Any, flatten: bool = False, keep_none: bool = True) -> Lis
     preserving the nested structure by default. Optionally, flatten and filter nulls.
     Compatible with Python 3.10 or above.
 
+    Non-recursive: nested lists/tuples of any depth are walked with an explicit stack,
+    and NumPy/pandas inputs are converted with vectorized astype(str) + pd.isna masks.
+
     Parameters:
     -----------
     x : Any
         Input data. Can be scalar, list, tuple, NumPy array, Pandas Series or DataFrame.
     flatten : bool, default=False
-        If True, flattens the output to a single list of strings.
+        If True, flattens the output to a single list of strings (see iter_string_list).
     keep_none : bool, default=True
         If False, filters out None, NaN, and null-like values.
 
@@ -25,52 +222,46 @@ def to_string_list(x: Any, flatten: bool = False, keep_none: bool = True) -> Lis
     Examples:
     ---------
     >>> to_string_list(42)
-    [['42']]
+    ['42']
 
     >>> to_string_list([1, None, 3], keep_none=False)
-    [['1', '3']]
+    [['1'], ['3']]
 
     >>> to_string_list([[1, 2], [3, None]], flatten=True, keep_none=False)
     ['1', '2', '3']
 
     >>> import numpy as np
     >>> to_string_list(np.array([[1, 2], [3, np.nan]]), flatten=False, keep_none=False)
-    [['1', '2', '3']]
+    ['1.0', '2.0', '3.0']
 
     >>> import pandas as pd
     >>> df = pd.DataFrame({'A': [1, None], 'B': ['x', 'y']})
     >>> to_string_list(df, keep_none=True)
     [['1.0', 'x'], ['nan', 'y']]
     """
+    if flatten:
+        return list(iter_string_list(x, keep_none=keep_none))
+    return _nested_strings(x, keep_none)
 
-    def is_null(val: Any) -> bool:
-        return val is None or (isinstance(val, float) and np.isnan(val)) or pd.isna(val)
-
-    def convert(val: Any) -> Any:
-        if isinstance(val, pd.DataFrame):
-            val = val.astype(str) if keep_none else val.dropna().astype(str)
-            return val.values.tolist()
-        elif isinstance(val, pd.Series):
-            val = val.astype(str) if keep_none else val.dropna().astype(str)
-            return val.tolist()
-        elif isinstance(val, np.ndarray):
-            if keep_none:
-                return val.astype(str).tolist()
-            else:
-                return [str(i) for i in val.flatten() if not is_null(i)]
-        elif isinstance(val, (list, tuple)):
-            return [convert(i) for i in val if keep_none or not is_null(i)]
-        else:
-            return [str(val)] if (keep_none or not is_null(val)) else []
-
-    def flatten_list(nested: Any) -> List[str]:
-        if isinstance(nested, list):
-            result = []
-            for item in nested:
-                result.extend(flatten_list(item))
-            return result
-        else:
-            return [nested]
 
-    structured = convert(x)
-    return flatten_list(structured) if flatten else structured
+if __name__ == "__main__":
+    import sys
+    import time
+
+    # python to_string_list.py [n]  (default 10,000,000 elements)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=n)
+    values[rng.random(n) < 0.1] = np.nan
+    nested = values.reshape(-1, 10).tolist()
+
+    for name, data in [('ndarray', values), ('nested list', nested)]:
+        for flatten in (False, True):
+            for keep_none in (True, False):
+                start = time.perf_counter()
+                result = to_string_list(data, flatten=flatten, keep_none=keep_none)
+                print(f"{name:12s} flatten={flatten!s:5s} keep_none={keep_none!s:5s} "
+                      f"{time.perf_counter() - start:8.2f}s  len={len(result):,}")
+        start = time.perf_counter()
+        count = sum(1 for _ in iter_string_list(data, keep_none=False))
+        print(f"{name:12s} iter_string_list(keep_none=False)      {time.perf_counter() - start:8.2f}s  count={count:,}")
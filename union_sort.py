@@ -0,0 +1,267 @@
+import pickle
+import tempfile
+import pandas as pd
+import numpy as np
+
+"""
+여러 DataFrame 을 수직 병합(UNION ALL) -> 정렬 -> 컬럼 순서 재정의 -> CSV 저장 을 한 번에 처리.
+
+1. union_sort(): 메모리 안에서 처리. 필요한 컬럼만 골라서 병합하고, 정렬 키만으로 순서를 구한 뒤
+   컬럼별로 한 번만 take 하므로 concat/replace/sort_values/reorder 마다 전체를 복사하지 않음.
+   object 컬럼의 None 은 np.nan 으로 통일됨(df.replace({None: np.nan}) 과 동일).
+2. iter_union_sort(): 입력이 메모리보다 클 때. chunk 들을 run_rows 단위로 정렬해 임시 파일(run)로 저장하고,
+   run 들을 block 단위로 병합(external merge sort)하여 정렬된 chunk 를 순서대로 yield.
+   결과는 union_sort() 와 같음(같은 키는 입력 순서 유지, NaN 은 마지막).
+3. export_csv() / export_pdf(): DataFrame 또는 chunk iterable 을 CSV / PDF(print2pdf.printer) 로 이어 쓰기.
+
+df_sorted = union_sort([df1, df2], by=['시스템 명칭', '테이블 ID'], columns=['시스템 명칭', '테이블 ID', '컬럼 명칭'])
+chunks = iter_union_sort(pd.read_csv('big.csv', chunksize=500_000), by=['시스템 명칭'])
+export_csv(chunks, 'big_sorted.csv')
+"""
+
+
+def _by_list(by):
+    """정렬 기준 컬럼을 list 로 (sort_values 처럼 컬럼 이름 하나만 줘도 됨)"""
+    return [by] if isinstance(by, str) else list(by)
+
+
+def _sort_order(keys, by, ascending):
+    # 정렬 결과의 행 위치(stable, NaN 은 마지막)
+    keys = keys.reset_index(drop=True)
+    return keys.sort_values(by=by, ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+
+
+def _take(column, order):
+    """컬럼을 order 순서로 가져옴(복사 1회). object 컬럼의 None/NaN 은 np.nan 으로 통일."""
+    if column.dtype == object:
+        values = column.to_numpy().take(order)
+        values[pd.isna(values)] = np.nan
+        return values
+    return column.array.take(order)
+
+
+def _column_union(frames):
+    # pd.concat 과 같은 컬럼 순서(처음 등장한 순서)
+    return list(dict.fromkeys(col for f in frames for col in f.columns))
+
+
+def _select(frame, columns):
+    if all(col in frame.columns for col in columns):
+        return frame[columns]
+    return frame.reindex(columns=columns)
+
+
+def union_sort(frames, by, ascending=True, columns=None):
+    """
+    DataFrame 들을 수직 병합하고 정렬한 결과를 반환(메모리 내 처리).
+
+    Parameters:
+        frames (Iterable[pd.DataFrame]): 병합할 DataFrame 들
+        by (str | list[str]): 정렬 기준 컬럼
+        ascending (bool | list[bool]): 정렬 방향
+        columns (list[str] | None): 출력 컬럼(순서 포함). 병합 전에 적용. 없는 컬럼은 NaN.
+
+    Returns:
+        pd.DataFrame: 정렬된 DataFrame (RangeIndex)
+    """
+    frames = list(frames)
+    by = _by_list(by)
+    columns = list(columns) if columns is not None else _column_union(frames)
+    if not frames:
+        return pd.DataFrame(columns=columns)
+
+    # 정렬 순서는 키 컬럼만 병합해서 계산
+    keys = pd.concat([_select(f, by) for f in frames], ignore_index=True)
+    order = _sort_order(keys, by, ascending)
+    del keys
+
+    # 컬럼별로 병합 -> take (한 번에 한 컬럼만 임시 복사본 존재)
+    data = {}
+    for col in columns:
+        merged = pd.concat([_select(f, [col]).iloc[:, 0] for f in frames], ignore_index=True)
+        data[col] = _take(merged, order)
+    return pd.DataFrame(data, columns=columns, copy=False)
+
+
+def _write_run(run, tmp_dir, block_rows):
+    f = tempfile.TemporaryFile(dir=tmp_dir)
+    for start in range(0, len(run), block_rows):
+        pickle.dump(run.iloc[start:start + block_rows], f, protocol=pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+
+def _read_blocks(f):
+    while True:
+        try:
+            yield pickle.load(f)
+        except EOFError:
+            return
+
+
+def _before(keys, bound, by, ascending, inclusive):
+    """keys 의 각 행이 정렬 순서상 bound 보다 앞(inclusive=True 이면 같은 값 포함)인지 여부"""
+    combined = pd.concat([keys, bound] if inclusive else [bound, keys], ignore_index=True)
+    rank = np.empty(len(combined), dtype=np.int64)
+    rank[_sort_order(combined, by, ascending)] = np.arange(len(combined))
+    if inclusive:
+        return rank[:len(keys)] < rank[len(keys)]
+    return rank[1:] < rank[0]
+
+
+def _merge_runs(run_files, by, ascending, block_rows):
+    """
+    정렬된 run 들을 block 단위로 병합. 디스크에 block 이 남아 있는 run 들의 버퍼 마지막 키 중 가장 작은 값(bound)
+    보다 앞선 행은 안전하게 출력할 수 있음. 출력 후 마지막 키가 bound 와 같은 run 은 다음 block 을 이어 읽음.
+    """
+    readers = [_read_blocks(f) for f in run_files]
+    buffers = [None] * len(readers)
+    done = [False] * len(readers)
+
+    def load(i):
+        block = next(readers[i], None)
+        if block is None:
+            done[i] = True
+        elif buffers[i] is None or buffers[i].empty:
+            buffers[i] = block
+        else:
+            buffers[i] = pd.concat([buffers[i], block])
+
+    while True:
+        for i in range(len(readers)):
+            while not done[i] and (buffers[i] is None or buffers[i].empty):
+                load(i)
+        live = [i for i in range(len(readers)) if buffers[i] is not None and not buffers[i].empty]
+        if all(done):
+            if live:
+                rest = pd.concat([buffers[i] for i in live])
+                yield rest.take(_sort_order(rest[by], by, ascending))
+            return
+
+        pending = [i for i in range(len(readers)) if not done[i]]
+        tails = pd.concat([buffers[i][by].iloc[-1:] for i in pending], ignore_index=True)
+        bound = tails.iloc[_sort_order(tails, by, ascending)[:1]]
+
+        # bound 보다 앞선 행 출력(run 순서대로 이어 붙여 stable 정렬하므로 같은 키는 입력 순서 유지)
+        combined = pd.concat([buffers[i] for i in live])
+        safe = _before(combined[by], bound, by, ascending, inclusive=False)
+        if safe.any():
+            order = _sort_order(combined[by], by, ascending)
+            yield combined.take(order[safe[order]])
+            offset = 0
+            for i in live:
+                n = len(buffers[i])
+                buffers[i] = buffers[i][~safe[offset:offset + n]]
+                offset += n
+
+        # 마지막 키가 bound 와 같은 run 은 다음 block 을 이어 읽음
+        at_bound = _before(tails, bound, by, ascending, inclusive=True)
+        for i, flag in zip(pending, at_bound):
+            if flag:
+                load(i)
+
+
+def iter_union_sort(chunks, by, ascending=True, columns=None, run_rows=1_000_000, block_rows=100_000, tmp_dir=None):
+    """
+    chunk 들을 병합·정렬해서 정렬된 chunk 를 순서대로 yield (external merge sort).
+    전체 크기가 run_rows 이하이면 디스크를 쓰지 않음.
+
+    Parameters:
+        chunks (Iterable[pd.DataFrame]): 입력 chunk 들 (예: 여러 파일의 read_csv(chunksize=...) 를 이어 붙인 것)
+        by (str | list[str]): 정렬 기준 컬럼
+        ascending (bool | list[bool]): 정렬 방향
+        columns (list[str] | None): 출력 컬럼(순서 포함, by 컬럼 포함 필요). 없으면 첫 chunk 의 컬럼.
+        run_rows (int): 메모리에서 한 번에 정렬할 최대 행 수(run 크기)
+        block_rows (int): run 파일 읽기/쓰기 단위 행 수
+        tmp_dir (str | None): run 임시 파일 위치
+
+    Yields:
+        pd.DataFrame: 정렬된 chunk (index 는 전체 결과 기준 행 번호)
+    """
+    by = _by_list(by)
+    pending, pending_rows = [], 0
+    run_files = []
+    try:
+        for chunk in chunks:
+            if columns is None:
+                columns = list(chunk.columns)
+            pending.append(_select(chunk, columns))
+            pending_rows += len(chunk)
+            if pending_rows >= run_rows:
+                run_files.append(_write_run(union_sort(pending, by, ascending, columns), tmp_dir, block_rows))
+                pending, pending_rows = [], 0
+        last_run = union_sort(pending, by, ascending, columns) if pending else None
+        del pending
+
+        if run_files:
+            if last_run is not None:
+                run_files.append(_write_run(last_run, tmp_dir, block_rows))
+                last_run = None
+            sorted_chunks = _merge_runs(run_files, by, ascending, block_rows)
+        elif last_run is not None:
+            sorted_chunks = (last_run.iloc[start:start + block_rows] for start in range(0, len(last_run), block_rows))
+        else:
+            sorted_chunks = iter(())
+        offset = 0
+        for chunk in sorted_chunks:
+            chunk = chunk.reset_index(drop=True)
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+    finally:
+        for f in run_files:
+            f.close()
+
+
+def export_csv(data, csv_filename, encoding='utf-8-sig', **to_csv_kwargs):
+    """DataFrame 또는 정렬된 chunk iterable 을 하나의 CSV 파일로 이어서 저장. 저장한 행 수 반환."""
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    rows = 0
+    with open(csv_filename, 'w', encoding=encoding, newline='') as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, header=(i == 0), **to_csv_kwargs)
+            rows += len(chunk)
+    return rows
+
+
+def export_pdf(data, pdf_filename, **printer_kwargs):
+    """
+    DataFrame 또는 정렬된 chunk iterable 을 print2pdf.printer 로 PDF 저장/출력(chunk 는 모으지 않고 그대로 전달).
+    printer_kwargs 는 printer 의 나머지 인자(print_backend, east_asian_width 등). reportlab 필요.
+    """
+    import print2pdf
+
+    print2pdf.printer(data, pdf_filename=pdf_filename, **printer_kwargs)
+
+
+if __name__ == "__main__":
+    # 간단한 검증: 기존 방식(concat -> replace -> sort_values -> reorder)과 결과 비교
+    rng = np.random.default_rng(0)
+
+    def sample(n, seq_no=False):
+        df = pd.DataFrame({
+            'SYS': rng.choice(np.array(['A', 'B', 'C', None], dtype=object), n),
+            'TBL': rng.choice(np.array([f"T{i}" for i in range(20)] + [None], dtype=object), n),
+            'VAL': rng.integers(0, 1000, n),
+        })
+        if seq_no:
+            df['SEQ_NO'] = np.arange(n)
+        return df
+
+    frames = [sample(3000), sample(2000), sample(5000, seq_no=True)]
+    by, columns = ['SYS', 'TBL'], ['TBL', 'SYS', 'VAL']
+    expected = (pd.concat(frames, ignore_index=True).replace({None: np.nan})
+                .sort_values(by=by, ascending=[True, False], ignore_index=True)[columns])
+
+    in_memory = union_sort(frames, by, ascending=[True, False], columns=columns)
+    streamed = pd.concat(iter_union_sort(iter(frames), by, ascending=[True, False], columns=columns,
+                                         run_rows=1500, block_rows=400))
+    print("union_sort     :", "OK" if in_memory.equals(expected) else "MISMATCH")
+    print("iter_union_sort:", "OK" if streamed.equals(expected) else "MISMATCH")
+
+    # by 를 컬럼 이름 하나(str)로 줘도 sort_values 와 같음
+    expected = (pd.concat(frames, ignore_index=True).replace({None: np.nan})
+                .sort_values(by='SYS', kind='stable', ignore_index=True)[columns])
+    in_memory = union_sort(frames, 'SYS', columns=columns)
+    streamed = pd.concat(iter_union_sort(iter(frames), 'SYS', columns=columns, run_rows=1500, block_rows=400))
+    print("by='SYS'       :", "OK" if in_memory.equals(expected) and streamed.equals(expected) else "MISMATCH")